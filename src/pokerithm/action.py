@@ -1,5 +1,7 @@
 """Action types and bot decision output."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from enum import Enum
 
@@ -14,7 +16,7 @@ class ActionType(Enum):
     ALL_IN = "all_in"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Action:
     """A concrete poker action.
 
@@ -26,6 +28,17 @@ class Action:
     type: ActionType
     amount: float = 0.0
 
+    @classmethod
+    def get(cls, type: ActionType, amount: float = 0.0) -> Action:
+        """Return an action, sharing one instance per sizeless action type.
+
+        Folds, checks and calls carry no amount, so the hot betting paths
+        can hand out the same frozen instance every time.
+        """
+        if amount:
+            return cls(type, amount)
+        return _SIZELESS[type]
+
     def __str__(self) -> str:
         if self.type == ActionType.RAISE:
             return f"Raise {self.amount:.1f} BB"
@@ -34,6 +47,9 @@ class Action:
         return self.type.value.capitalize()
 
 
+_SIZELESS: dict[ActionType, Action] = {t: Action(t) for t in ActionType}
+
+
 @dataclass(frozen=True)
 class BotDecision:
     """The bot's recommended action with reasoning.
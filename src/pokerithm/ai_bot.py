@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import subprocess
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from .action import Action, ActionType, BotDecision
@@ -82,7 +83,7 @@ def _extract_json(text: str) -> str:
     return text
 
 
-def _format_cards(cards: list[Card]) -> str:
+def _format_cards(cards: Sequence[Card]) -> str:
     return " ".join(str(c) for c in cards) if cards else "none"
 
 
@@ -46,31 +46,28 @@ class BettingRound:
         if self.min_raise == 0:
             self.min_raise = self.big_blind
 
-        active = [p for p in self.players if p.is_active]
-        if len(active) <= 1:
+        if sum(1 for p in self.players if p.is_active) <= 1:
             return
 
         acted: set[int] = set()
         last_raiser: int | None = None
         raise_count = 0
+        # Players not folded; only a fold changes it, so no rescans needed
+        in_hand = sum(1 for p in self.players if p.is_in_hand)
 
         while True:
-            all_done = True
-
-            for player in self.players:
-                if not player.is_active:
-                    continue
-
-                # Skip if already acted and no new raise to respond to
+            # Only the player to act can fold or go all-in, so the seats
+            # still able to act are fixed for the rest of the pass
+            order = [p for p in self.players if p.is_active]
+            reopened = False
+
+            for player in order:
+                # Skip if already acted and there's no new raise to respond
+                # to, or the raise is theirs or already matched
                 if player.seat in acted and (
-                    last_raiser is None or player.seat == last_raiser
-                ):
-                    continue
-
-                # Skip if already matched the current bet
-                if (
-                    player.seat in acted
-                    and player.current_bet >= self.current_bet
+                    last_raiser is None
+                    or player.seat == last_raiser
+                    or player.current_bet >= self.current_bet
                 ):
                     continue
 
@@ -83,9 +80,9 @@ class BettingRound:
                     ActionType.ALL_IN,
                 ):
                     if ctx.to_call > 0:
-                        action = Action(ActionType.CALL)
+                        action = Action.get(ActionType.CALL)
                     else:
-                        action = Action(ActionType.CHECK)
+                        action = Action.get(ActionType.CHECK)
 
                 self._apply_action(player, action)
                 acted.add(player.seat)
@@ -100,26 +97,24 @@ class BettingRound:
                         self.min_raise = max(self.min_raise, raise_increment)
                         last_raiser = player.seat
                         raise_count += 1
-                        all_done = False
-                        break  # restart the loop so everyone gets to respond
+                        reopened = True
+                        break  # restart the pass so everyone gets to respond
 
-                if self.is_complete():
-                    return
+                if action.type == ActionType.FOLD:
+                    in_hand -= 1
+                    if in_hand <= 1:
+                        return
 
-            if all_done:
+            if not reopened:
                 break
 
             # Check if anyone still needs to act
-            needs_action = False
-            for p in self.players:
-                if not p.is_active:
-                    continue
-                if p.seat == last_raiser:
-                    continue
-                if p.current_bet < self.current_bet:
-                    needs_action = True
-                    break
-            if not needs_action:
+            if not any(
+                p.is_active
+                and p.seat != last_raiser
+                and p.current_bet < self.current_bet
+                for p in order
+            ):
                 break
 
     def _apply_action(self, player: Player, action: Action) -> None:
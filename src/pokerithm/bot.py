@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import random
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from .action import Action, ActionType, BotDecision
@@ -87,6 +89,8 @@ class BotConfig:
         tightness: 0 = loose, 1 = nit.  Contracts the opening ranges.
         raise_sizing: Default open-raise in big blinds.
         seed: RNG seed for reproducible decisions.
+        equity_fn: Postflop equity (0-100) for a spot, used in place of the
+            Monte Carlo estimate; e.g. a lookup table or a test stub.
     """
 
     aggression: float = 0.6
@@ -94,17 +98,22 @@ class BotConfig:
     tightness: float = 0.5
     raise_sizing: float = 2.5
     seed: int | None = None
+    equity_fn: Callable[[GameState], float] | None = None
 
+    def compile(self) -> Callable[[GameState], BotDecision]:
+        """Build a bot for this config and return its decision function."""
+        return Bot(self).decide
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class GameState:
     """Snapshot of the game at decision time.
 
     All monetary values are in big-blind units.
     """
 
-    hole_cards: list[Card]
-    community: list[Card]
+    hole_cards: tuple[Card, ...]
+    community: tuple[Card, ...]
     position: Position
     num_opponents: int
     pot_bb: float
@@ -114,12 +123,34 @@ class GameState:
     invested_bb: float = 0.0  # chips already invested this hand in BB
 
 
+# Postflop equity estimates kept per bot, keyed by the cards and opponent count
+_EQUITY_CACHE_SIZE = 256
+
+
 class Bot:
     """TAG poker decision engine."""
 
     def __init__(self, config: BotConfig | None = None) -> None:
-        self._cfg = config or BotConfig()
-        self._rng = random.Random(self._cfg.seed)
+        self._cfg = cfg = config or BotConfig()
+        # Config knobs copied out once; they are read on every decision
+        self._aggression = cfg.aggression
+        self._bluff_frequency = cfg.bluff_frequency
+        self._tightness = cfg.tightness
+        self._raise_sizing = cfg.raise_sizing
+        self._equity_fn = cfg.equity_fn
+        # Postflop raise thresholds (equity %), normal and at low SPR
+        self._raise_threshold = 65 - (cfg.aggression * 15)  # 50-65%
+        self._low_spr_raise_threshold = self._raise_threshold - 10
+        self._rng = random.Random(cfg.seed)
+        # Bound once; reset() reseeds this same generator
+        self._random = self._rng.random
+        self._gauss = self._rng.gauss
+        self._equity_cache: OrderedDict[tuple, float] = OrderedDict()
+
+    def reset(self) -> None:
+        """Reseed the RNG and drop cached equities, as if newly built."""
+        self._rng.seed(self._cfg.seed)
+        self._equity_cache.clear()
 
     def decide(self, state: GameState) -> BotDecision:
         if state.street == "preflop":
@@ -261,15 +292,15 @@ class Bot:
         )
 
         # Add noise to tightness
-        noise = self._rng.gauss(0, 0.08)
-        effective_tightness = max(0.0, min(1.0, self._cfg.tightness + noise))
+        noise = self._gauss(0, 0.08)
+        effective_tightness = max(0.0, min(1.0, self._tightness + noise))
 
         in_raise = key in raise_range
         in_call = key in call_range
 
         # Tight players occasionally fold hands at the bottom of their range
         if effective_tightness > 0.7 and not self._is_premium(key):
-            if self._rng.random() < (effective_tightness - 0.5):
+            if self._random() < (effective_tightness - 0.5):
                 in_raise = False
                 in_call = False
 
@@ -323,16 +354,10 @@ class Bot:
     # ── Postflop ─────────────────────────────────────────────
 
     def _postflop(self, state: GameState) -> BotDecision:
-        equity_result = calculate_equity(
-            hero_cards=state.hole_cards,
-            community=state.community,
-            num_opponents=state.num_opponents,
-            num_simulations=2000,
-        )
-        raw_equity = equity_result.equity  # 0-100
+        raw_equity = self._equity(state)  # 0-100
 
         # Add noise for imperfect play
-        equity = raw_equity + self._rng.gauss(0, 5)
+        equity = raw_equity + self._gauss(0, 5)
         equity = max(0.0, min(100.0, equity))
 
         pot_odds = (
@@ -345,8 +370,7 @@ class Bot:
         spr = self._spr(state)
         committed = self._is_pot_committed(state)
 
-        # Dynamic thresholds based on aggression
-        raise_threshold = 65 - (self._cfg.aggression * 15)  # 50-65%
+        # Dynamic thresholds: raising scales with aggression, calling with pot odds
         call_threshold = max(pot_odds, 25.0) if state.to_call_bb > 0 else 15.0
 
         # Pot committed: only fold complete air
@@ -355,7 +379,9 @@ class Bot:
 
         # Low SPR: commit with stronger hands more readily
         if spr is not None and spr < 3:
-            raise_threshold -= 10
+            raise_threshold = self._low_spr_raise_threshold
+        else:
+            raise_threshold = self._raise_threshold
 
         # Raise strong hands
         if equity >= raise_threshold:
@@ -425,10 +451,41 @@ class Bot:
 
     # ── Helpers ───────────────────────────────────────────────
 
+    def _equity(self, state: GameState) -> float:
+        """Monte Carlo equity, reused when the same spot comes up again.
+
+        Only the simulation is cached; the decision itself still draws fresh
+        noise from the bot's RNG on every call.
+        """
+        if self._equity_fn is not None:
+            return self._equity_fn(state)
+
+        key = (
+            frozenset(state.hole_cards),
+            frozenset(state.community),
+            state.num_opponents,
+        )
+        cache = self._equity_cache
+        equity = cache.get(key)
+        if equity is not None:
+            cache.move_to_end(key)
+            return equity
+
+        equity = calculate_equity(
+            hero_cards=state.hole_cards,
+            community=state.community,
+            num_opponents=state.num_opponents,
+            num_simulations=2000,
+        ).equity
+        cache[key] = equity
+        if len(cache) > _EQUITY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return equity
+
     def _open_raise_sizing(self) -> float:
         """Randomised open-raise size around the configured default."""
-        base = self._cfg.raise_sizing
-        noise = self._rng.gauss(0, 0.3)
+        base = self._raise_sizing
+        noise = self._gauss(0, 0.3)
         return round(max(2.0, base + noise), 1)
 
     def _postflop_raise_sizing(
@@ -448,25 +505,25 @@ class Bot:
             base = max(base, state.stack_bb)
 
         # Add noise (±15%)
-        noise = self._rng.gauss(1.0, 0.15)
+        noise = self._gauss(1.0, 0.15)
         return round(max(1.0, base * noise), 1)
 
     def _should_bluff(self, state: GameState) -> bool:
         """Roll the dice for a bluff attempt."""
-        if self._cfg.bluff_frequency <= 0:
+        if self._bluff_frequency <= 0:
             return False
-        return self._rng.random() < self._cfg.bluff_frequency * self._cfg.aggression
+        return self._random() < self._bluff_frequency * self._aggression
 
     def _should_bluff_postflop(self, state: GameState, equity: float) -> bool:
         """Smarter postflop bluff: considers position, board texture, and draws."""
-        if self._cfg.bluff_frequency <= 0:
+        if self._bluff_frequency <= 0:
             return False
 
         # Only bluff from late position or blinds (can represent a check-raise)
         if not (state.position.is_late or state.position.is_blind):
             return False
 
-        base_freq = self._cfg.bluff_frequency * self._cfg.aggression
+        base_freq = self._bluff_frequency * self._aggression
 
         # Boost bluff frequency on dry boards (fewer draws = more fold equity)
         if self._is_dry_board(state.community):
@@ -480,7 +537,7 @@ class Bot:
         if state.street == "river":
             base_freq *= 0.5
 
-        return self._rng.random() < base_freq
+        return self._random() < base_freq
 
     def _spr(self, state: GameState) -> float | None:
         """Stack-to-pot ratio. None if stack info unavailable."""
@@ -516,7 +573,7 @@ class Bot:
         return False
 
     @staticmethod
-    def _is_dry_board(community: list[Card]) -> bool:
+    def _is_dry_board(community: tuple[Card, ...]) -> bool:
         """A board is 'dry' if it has no flush draws and no connected cards."""
         if len(community) < 3:
             return True
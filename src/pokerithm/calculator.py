@@ -1,11 +1,16 @@
 """Poker odds and equity calculator using Monte Carlo simulation."""
 
+import random
 from dataclasses import dataclass
-from typing import Sequence
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+from typing import Literal, Sequence
 
 from .card import Card, Rank, Suit
 from .deck import Deck
 from .hand import Hand, HandRank
+from .ranges import hole_cards_to_key, key_to_hole_cards
 
 
 @dataclass
@@ -15,7 +20,7 @@ class EquityResult:
     win_rate: float       # Probability of winning (0-1)
     tie_rate: float       # Probability of tying (0-1)
     lose_rate: float      # Probability of losing (0-1)
-    simulations: int      # Number of simulations run
+    simulations: int      # Number of simulations (or enumerated run-outs)
     hand_distribution: dict[HandRank, int]  # How often each hand was made
 
     @property
@@ -47,9 +52,14 @@ def calculate_equity(
     community: Sequence[Card] | None = None,
     num_opponents: int = 1,
     num_simulations: int = 10000,
+    mode: Literal["auto", "exhaustive", "mc"] = "auto",
+    seed: int | None = None,
 ) -> EquityResult:
     """Calculate win probability using Monte Carlo simulation.
 
+    When every opponent's cards are known, the remaining board run-outs
+    can be enumerated for an exact answer instead.
+
     Args:
         hero_cards: Your hole cards (2 cards)
         villain_cards: One opponent's known hole cards (2 cards), or None for random
@@ -57,6 +67,11 @@ def calculate_equity(
         num_opponents: Number of opponents (default 1). If villain_cards is provided,
                        that counts as 1 known opponent; remaining are random.
         num_simulations: Number of random simulations to run
+        mode: "mc" always samples; "exhaustive" enumerates every run-out
+              (all opponents must be known); "auto" enumerates when that
+              takes no more evaluations than ``num_simulations``.
+        seed: Seeds a private RNG for reproducible sampling; None uses the
+              module-level ``random`` generator.
 
     Returns:
         EquityResult with win/tie/lose rates
@@ -73,6 +88,8 @@ def calculate_equity(
         raise ValueError("Community can have at most 5 cards")
     if num_opponents < 1:
         raise ValueError("Must have at least 1 opponent")
+    if mode not in ("auto", "exhaustive", "mc"):
+        raise ValueError(f"Unknown equity mode: {mode}")
 
     wins = 0
     ties = 0
@@ -84,39 +101,59 @@ def calculate_equity(
 
     # How many random opponents to deal
     random_opponents = num_opponents if villain_cards is None else num_opponents - 1
+    cards_needed = 5 - len(community)
+
+    if mode == "exhaustive" and random_opponents:
+        raise ValueError("Exhaustive equity needs every opponent's hole cards")
+    unseen = [c for c in Deck().cards if c not in known_cards]
+    exhaustive = mode == "exhaustive" or (
+        mode == "auto"
+        and random_opponents == 0
+        and comb(len(unseen), cards_needed) <= num_simulations
+    )
 
+    if exhaustive:
+        known_opponents = [list(villain_cards or [])]
+        runs = 0
+        for runout in combinations(unseen, cards_needed):
+            runs += 1
+            outcome = _showdown(
+                hero_cards, known_opponents, community + list(runout), hand_counts
+            )
+            if outcome > 0:
+                wins += 1
+            elif outcome < 0:
+                losses += 1
+            else:
+                ties += 1
+        return EquityResult(
+            win_rate=wins / runs,
+            tie_rate=ties / runs,
+            lose_rate=losses / runs,
+            simulations=runs,
+            hand_distribution=hand_counts,
+        )
+
+    # Each run draws the random hole cards and the rest of the board at once
+    sample = (random.Random(seed) if seed is not None else random).sample
+    dealt_holes = 2 * random_opponents
     for _ in range(num_simulations):
-        # Create deck without known cards
-        deck = Deck()
-        deck.cards = [c for c in deck.cards if c not in known_cards]
-        deck.shuffle()
+        drawn = sample(unseen, dealt_holes + cards_needed)
 
         # Build list of opponent hands
         opponent_hands: list[list[Card]] = []
         if villain_cards:
-            opponent_hands.append(list(villain_cards))
-        for _ in range(random_opponents):
-            opponent_hands.append(deck.deal(2))
+            opponent_hands.append(villain_cards)
+        for i in range(0, dealt_holes, 2):
+            opponent_hands.append(drawn[i:i + 2])
 
         # Complete community cards
-        cards_needed = 5 - len(community)
-        sim_community = community + deck.deal(cards_needed)
-
-        # Evaluate hero hand
-        hero_hand = Hand(cards=hero_cards + sim_community)
-        hero_value = hero_hand.value
-        hand_counts[hero_value.rank] += 1
-
-        # Evaluate all opponent hands
-        opponent_values = [
-            Hand(cards=opp + sim_community).value for opp in opponent_hands
-        ]
-        best_opponent = max(opponent_values)
+        sim_community = community + drawn[dealt_holes:]
 
-        # Compare against best opponent
-        if hero_value > best_opponent:
+        outcome = _showdown(hero_cards, opponent_hands, sim_community, hand_counts)
+        if outcome > 0:
             wins += 1
-        elif hero_value < best_opponent:
+        elif outcome < 0:
             losses += 1
         else:
             ties += 1
@@ -130,6 +167,28 @@ def calculate_equity(
     )
 
 
+def _showdown(
+    hero_cards: list[Card],
+    opponent_hands: list[list[Card]],
+    board: list[Card],
+    hand_counts: dict[HandRank, int],
+) -> int:
+    """Compare hero with the best opponent on a full board.
+
+    Tallies hero's made hand in ``hand_counts`` and returns 1 for a win,
+    0 for a tie and -1 for a loss.
+    """
+    hero_value = Hand(cards=hero_cards + board).value
+    hand_counts[hero_value.rank] += 1
+
+    best_opponent = max(Hand(cards=opp + board).value for opp in opponent_hands)
+    if hero_value > best_opponent:
+        return 1
+    if hero_value < best_opponent:
+        return -1
+    return 0
+
+
 def calculate_outs(
     hole_cards: Sequence[Card],
     community: Sequence[Card],
@@ -214,31 +273,57 @@ def preflop_equity(
     hero_cards: Sequence[Card],
     num_opponents: int = 1,
     num_simulations: int = 10000,
+    seed: int | None = None,
 ) -> float:
     """Calculate preflop win equity against random opponents.
 
+    Seeded calls are cached per range key: equity against random hands
+    doesn't depend on the exact suits, so AhKh and AsKs share one run.
+
     Args:
         hero_cards: Your 2 hole cards
         num_opponents: Number of opponents with random hands
         num_simulations: Number of simulations
+        seed: Seeds a private RNG for reproducible sampling
 
     Returns:
         Win equity as percentage (0-100)
     """
-    hero_cards = list(hero_cards)
+    if seed is None:
+        return _preflop_equity_impl(list(hero_cards), num_opponents, num_simulations)
+    key = hole_cards_to_key(*hero_cards)
+    return _preflop_equity_cached(key, num_opponents, num_simulations, seed)
+
+
+@lru_cache(maxsize=512)
+def _preflop_equity_cached(
+    key: str, num_opponents: int, num_simulations: int, seed: int
+) -> float:
+    return _preflop_equity_impl(
+        key_to_hole_cards(key), num_opponents, num_simulations, random.Random(seed)
+    )
+
+
+def _preflop_equity_impl(
+    hero_cards: list[Card],
+    num_opponents: int,
+    num_simulations: int,
+    rng: random.Random | None = None,
+) -> float:
     wins = 0
     ties = 0
 
+    unseen = [c for c in Deck().cards if c not in hero_cards]
+    sample = (rng or random).sample
+    dealt_holes = 2 * num_opponents
     for _ in range(num_simulations):
-        deck = Deck()
-        deck.cards = [c for c in deck.cards if c not in hero_cards]
-        deck.shuffle()
+        drawn = sample(unseen, dealt_holes + 5)
 
         # Deal opponents
-        opponents = [deck.deal(2) for _ in range(num_opponents)]
+        opponents = [drawn[i:i + 2] for i in range(0, dealt_holes, 2)]
 
         # Deal community
-        community = deck.deal(5)
+        community = drawn[dealt_holes:]
 
         # Evaluate all hands
         hero_value = Hand(cards=hero_cards + community).value
@@ -2,6 +2,7 @@
 
 from enum import IntEnum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Self
 
 
@@ -106,7 +107,8 @@ class Card:
         return cls(rank=rank, suit=suit)
 
 
-# Convenience function
+# Convenience function; cards are immutable, so repeat spellings share one
+@lru_cache(maxsize=256)
 def card(s: str) -> Card:
     """Shorthand for Card.from_str()."""
     return Card.from_str(s)
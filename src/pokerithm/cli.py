@@ -471,8 +471,8 @@ def interactive(
                     raise_sizing=config.bot.raise_sizing,
                 )
                 game_state = GameState(
-                    hole_cards=hero_cards,
-                    community=list(community),
+                    hole_cards=tuple(hero_cards),
+                    community=tuple(community),
                     position=position,
                     num_opponents=opponents,
                     pot_bb=pot_bb,
@@ -525,8 +525,8 @@ def bot_command(
             raise_sizing=config.bot.raise_sizing,
         )
         game_state = GameState(
-            hole_cards=hero_cards,
-            community=community,
+            hole_cards=tuple(hero_cards),
+            community=tuple(community),
             position=pos,
             num_opponents=opponents,
             pot_bb=pot,
@@ -11,12 +11,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from .calculator import preflop_equity
-from .card import Card, Rank, Suit
 from .nash_ranges import (
     VILLAIN_CALL_RANGES,
     get_shove_range,
     is_in_range,
 )
+from .ranges import key_to_hole_cards
 
 
 @dataclass(frozen=True)
@@ -197,7 +197,7 @@ def _calculate_raise_ev(
 
 def _equity_vs_range(hand_key: str, villain_range: set[str], sims: int = 3000) -> float:
     """Estimate hero equity when called by villain's range via Monte Carlo."""
-    hero_cards = _hand_key_to_cards(hand_key)
+    hero_cards = key_to_hole_cards(hand_key)
 
     sample = list(villain_range)[:8]
     if not sample:
@@ -205,11 +205,15 @@ def _equity_vs_range(hand_key: str, villain_range: set[str], sims: int = 3000) -
 
     total_eq = 0.0
     count = 0
-    for vkey in sample:
-        vcards = _hand_key_to_cards(vkey)
+    # Seeding each run by its slot lets repeat decisions for the same hand
+    # reuse the cached preflop equity instead of resampling.
+    for i, vkey in enumerate(sample):
+        vcards = key_to_hole_cards(vkey)
         if any(c in hero_cards for c in vcards):
             continue
-        eq = preflop_equity(hero_cards, num_opponents=1, num_simulations=sims // len(sample))
+        eq = preflop_equity(
+            hero_cards, num_opponents=1, num_simulations=sims // len(sample), seed=i
+        )
         total_eq += eq
         count += 1
 
@@ -227,34 +231,6 @@ def _equity_vs_range(hand_key: str, villain_range: set[str], sims: int = 3000) -
     return min(base_eq * strength_adj, 100.0)
 
 
-def _hand_key_to_cards(key: str) -> list[Card]:
-    """Convert a hand key like 'AKs' to two Card objects."""
-    if len(key) == 2:
-        r = _rank_from_char(key[0])
-        return [Card(r, Suit.SPADES), Card(r, Suit.HEARTS)]
-    elif len(key) == 3:
-        r1 = _rank_from_char(key[0])
-        r2 = _rank_from_char(key[1])
-        if key[2] == "s":
-            return [Card(r1, Suit.SPADES), Card(r2, Suit.SPADES)]
-        else:
-            return [Card(r1, Suit.SPADES), Card(r2, Suit.HEARTS)]
-    raise ValueError(f"Invalid hand key: {key}")
-
-
-def _rank_from_char(c: str) -> Rank:
-    """Convert a single character to a Rank."""
-    rank_map = {
-        "A": Rank.ACE, "K": Rank.KING, "Q": Rank.QUEEN, "J": Rank.JACK,
-        "T": Rank.TEN, "9": Rank.NINE, "8": Rank.EIGHT, "7": Rank.SEVEN,
-        "6": Rank.SIX, "5": Rank.FIVE, "4": Rank.FOUR, "3": Rank.THREE,
-        "2": Rank.TWO,
-    }
-    if c not in rank_map:
-        raise ValueError(f"Invalid rank character: {c}")
-    return rank_map[c]
-
-
 def _normalize_hand_key(hand: str) -> str:
     """Normalize hand input to canonical key format."""
     hand = hand.strip()
@@ -1,10 +1,15 @@
 """Deck of cards for poker."""
 
+from __future__ import annotations
+
 import random
 from dataclasses import dataclass, field
 
 from .card import Card, Rank, Suit
 
+# Cards are immutable, so every deck can share the same 52 instances
+_FULL_DECK: tuple[Card, ...] = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
+
 
 @dataclass
 class Deck:
@@ -19,24 +24,47 @@ class Deck:
 
     def reset(self) -> None:
         """Reset to a full 52-card deck."""
-        self.cards = [Card(rank, suit) for suit in Suit for rank in Rank]
+        self.cards = list(_FULL_DECK)
         self._dealt = set()
 
-    def shuffle(self) -> None:
-        """Shuffle the remaining cards."""
-        random.shuffle(self.cards)
+    def reset_and_shuffle(self, rng: random.Random | None = None) -> None:
+        """Refill to all 52 cards in place and shuffle, for reuse across hands.
+
+        Gives the same order as a fresh ``Deck()`` shuffled with ``rng``.
+        """
+        self.cards[:] = _FULL_DECK
+        self._dealt.clear()
+        self.shuffle(rng)
+
+    def shuffle(self, rng: random.Random | None = None) -> None:
+        """Shuffle the remaining cards.
+
+        Args:
+            rng: Random source to shuffle with, for reproducible deals.
+                 Defaults to the module-level ``random`` generator.
+        """
+        (rng or random).shuffle(self.cards)
 
     def deal(self, n: int = 1) -> list[Card]:
         """Deal n cards from the top of the deck."""
-        if n > len(self.cards):
-            raise ValueError(f"Cannot deal {n} cards, only {len(self.cards)} remaining")
-        dealt = [self.cards.pop() for _ in range(n)]
+        cards = self.cards
+        if n > len(cards):
+            raise ValueError(f"Cannot deal {n} cards, only {len(cards)} remaining")
+        if n <= 0:
+            return []
+        # The top of the deck is the end of the list, dealt last card first
+        dealt = cards[:-n - 1:-1]
+        del cards[-n:]
         self._dealt.update(dealt)
         return dealt
 
     def deal_one(self) -> Card:
         """Deal a single card."""
-        return self.deal(1)[0]
+        if not self.cards:
+            raise ValueError("Cannot deal 1 cards, only 0 remaining")
+        card = self.cards.pop()
+        self._dealt.add(card)
+        return card
 
     def remove(self, *cards: Card) -> None:
         """Remove specific cards from the deck (e.g., known cards)."""
@@ -3,7 +3,7 @@
 from collections import Counter
 from dataclasses import dataclass
 from enum import IntEnum
-from itertools import combinations
+from functools import cached_property
 from typing import Self
 
 from .card import Card, Rank
@@ -67,18 +67,11 @@ class Hand:
         """
         if len(self.cards) == 5:
             return _evaluate_five(self.cards)
+        return _evaluate_best(self.cards)
 
-        # Find best 5-card combination
-        best: HandValue | None = None
-        for five_cards in combinations(self.cards, 5):
-            value = _evaluate_five(list(five_cards))
-            if best is None or value > best:
-                best = value
-        return best  # type: ignore
-
-    @property
+    @cached_property
     def value(self) -> HandValue:
-        """Shorthand for evaluate()."""
+        """Shorthand for evaluate(), worked out once per hand."""
         return self.evaluate()
 
 
@@ -136,6 +129,85 @@ def _evaluate_five(cards: list[Card]) -> HandValue:
     return HandValue(HandRank.HIGH_CARD, (ranks[0],), tuple(ranks[1:]))
 
 
+def _evaluate_best(cards: list[Card]) -> HandValue:
+    """Evaluate the best 5-card hand out of 6 or more cards in one pass.
+
+    Gives the same value as taking the best `_evaluate_five` over every
+    5-card combination, without building the combinations.
+    """
+    counts: dict[int, int] = {}
+    by_suit: dict[int, list[int]] = {}
+    for c in cards:
+        r = c.rank.value
+        counts[r] = counts.get(r, 0) + 1
+        by_suit.setdefault(c.suit, []).append(r)
+
+    # Flushes and straight flushes
+    flush: list[int] | None = None
+    for suited in by_suit.values():
+        if len(suited) >= 5:
+            flush = sorted(suited, reverse=True)
+            break
+    if flush is not None:
+        high = _straight_high(flush)
+        if high:
+            return HandValue(HandRank.STRAIGHT_FLUSH, (high,), ())
+
+    # Distinct ranks, highest first, grouped by how often they appear
+    ranks = sorted(counts, reverse=True)
+    quads = [r for r in ranks if counts[r] >= 4]
+    trips = [r for r in ranks if counts[r] == 3]
+    pairs = [r for r in ranks if counts[r] == 2]
+
+    if quads:
+        quad = quads[0]
+        kicker = next(r for r in ranks if r != quad)
+        return HandValue(HandRank.FOUR_OF_A_KIND, (quad,), (kicker,))
+
+    if trips and (len(trips) > 1 or pairs):
+        # A second set of trips can make up the pair
+        pair = max(trips[1:] + pairs)
+        return HandValue(HandRank.FULL_HOUSE, (trips[0], pair), ())
+
+    if flush is not None:
+        return HandValue(HandRank.FLUSH, tuple(flush[:5]), ())
+
+    high = _straight_high(ranks)
+    if high:
+        return HandValue(HandRank.STRAIGHT, (high,), ())
+
+    if trips:
+        kickers = tuple(r for r in ranks if r != trips[0])[:2]
+        return HandValue(HandRank.THREE_OF_A_KIND, (trips[0],), kickers)
+
+    if len(pairs) >= 2:
+        top = (pairs[0], pairs[1])
+        kicker = next(r for r in ranks if r not in top)
+        return HandValue(HandRank.TWO_PAIR, top, (kicker,))
+
+    if pairs:
+        kickers = tuple(r for r in ranks if r != pairs[0])[:3]
+        return HandValue(HandRank.ONE_PAIR, (pairs[0],), kickers)
+
+    return HandValue(HandRank.HIGH_CARD, (ranks[0],), tuple(ranks[1:5]))
+
+
+def _straight_high(ranks: list[int]) -> int:
+    """High card of the best straight in descending ``ranks``, or 0 if none."""
+    distinct = sorted(set(ranks), reverse=True)
+    if 14 in distinct:
+        distinct.append(1)  # ace plays low in the wheel
+    run = 1
+    for i in range(1, len(distinct)):
+        if distinct[i] == distinct[i - 1] - 1:
+            run += 1
+            if run == 5:
+                return distinct[i] + 4
+        else:
+            run = 1
+    return 0
+
+
 def _check_straight(ranks: list[Rank]) -> tuple[bool, int]:
     """Check if sorted ranks form a straight. Returns (is_straight, high_card)."""
     values = [r.value for r in ranks]
@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from .card import Card
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class PlayerActionContext:
-    """Read-only snapshot given to human/bot when deciding.
+    """Snapshot given to human/bot when deciding.
 
-    All monetary values are in chips (int), not big blinds.
+    All monetary values are in chips (int), not big blinds. A table reuses
+    one instance per hand and refreshes it before each decision, so read it
+    during the callback rather than keeping it.
     """
 
-    hole_cards: list[Card]
-    community: list[Card]
+    hole_cards: tuple[Card, ...]
+    community: tuple[Card, ...]
     pot_total: int
     to_call: int
     min_raise: int
@@ -26,7 +28,7 @@ class PlayerActionContext:
     position_label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """A player at the poker table."""
 
@@ -35,7 +37,7 @@ class Player:
     seat: int
     is_human: bool = False
 
-    hole_cards: list[Card] = field(default_factory=list)
+    hole_cards: tuple[Card, ...] = ()
     is_folded: bool = False
     is_all_in: bool = False
     current_bet: int = 0
@@ -58,7 +60,7 @@ class Player:
 
     def reset_for_new_hand(self) -> None:
         """Reset per-hand state."""
-        self.hole_cards = []
+        self.hole_cards = ()
         self.is_folded = False
         self.is_all_in = False
         self.current_bet = 0
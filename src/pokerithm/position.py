@@ -1,5 +1,6 @@
 """Table position representation for poker."""
 
+import sys
 from enum import IntEnum
 
 
@@ -20,49 +21,51 @@ class Position(IntEnum):
     SB = 6
     BB = 7
 
-    @property
-    def label(self) -> str:
-        """Human-readable position name."""
-        return {
-            Position.UTG: "Under the Gun (UTG)",
-            Position.UTG_1: "UTG+1",
-            Position.MP: "Middle Position (MP)",
-            Position.HJ: "Hijack (HJ)",
-            Position.CO: "Cutoff (CO)",
-            Position.BTN: "Button (BTN)",
-            Position.SB: "Small Blind (SB)",
-            Position.BB: "Big Blind (BB)",
-        }[self]
-
-    @property
-    def short(self) -> str:
-        """Short abbreviation (e.g. 'UTG', 'BTN')."""
-        return {
-            Position.UTG: "UTG",
-            Position.UTG_1: "UTG+1",
-            Position.MP: "MP",
-            Position.HJ: "HJ",
-            Position.CO: "CO",
-            Position.BTN: "BTN",
-            Position.SB: "SB",
-            Position.BB: "BB",
-        }[self]
-
-    @property
-    def is_early(self) -> bool:
-        return self in (Position.UTG, Position.UTG_1)
-
-    @property
-    def is_middle(self) -> bool:
-        return self in (Position.MP, Position.HJ)
-
-    @property
-    def is_late(self) -> bool:
-        return self in (Position.CO, Position.BTN)
-
-    @property
-    def is_blind(self) -> bool:
-        return self in (Position.SB, Position.BB)
+    # Per-member constants, set once below the class
+    label: str  # Human-readable position name
+    short: str  # Short abbreviation (e.g. 'UTG', 'BTN')
+    is_early: bool
+    is_middle: bool
+    is_late: bool
+    is_blind: bool
+
+
+# Indexed by Position value; interned so every use shares one string
+_LABELS = tuple(map(sys.intern, (
+    "Under the Gun (UTG)",
+    "UTG+1",
+    "Middle Position (MP)",
+    "Hijack (HJ)",
+    "Cutoff (CO)",
+    "Button (BTN)",
+    "Small Blind (SB)",
+    "Big Blind (BB)",
+)))
+_SHORT = tuple(map(sys.intern, ("UTG", "UTG+1", "MP", "HJ", "CO", "BTN", "SB", "BB")))
+
+# Bit ``value`` is set for each member of the group
+_EARLY_MASK = 1 << Position.UTG | 1 << Position.UTG_1
+_MIDDLE_MASK = 1 << Position.MP | 1 << Position.HJ
+_LATE_MASK = 1 << Position.CO | 1 << Position.BTN
+_BLIND_MASK = 1 << Position.SB | 1 << Position.BB
+
+
+def _set_member_constants() -> None:
+    for pos in Position:
+        pos.label = _LABELS[pos]
+        pos.short = _SHORT[pos]
+        pos.is_early = bool(_EARLY_MASK >> pos & 1)
+        pos.is_middle = bool(_MIDDLE_MASK >> pos & 1)
+        pos.is_late = bool(_LATE_MASK >> pos & 1)
+        pos.is_blind = bool(_BLIND_MASK >> pos & 1)
+
+
+_set_member_constants()
+
+
+# Seat counts covered by the precomputed table; larger tables fall back
+# to computing the mapping directly
+MAX_SEATS = 10
 
 
 def position_from_utg_distance(utg_distance: int, total_players: int) -> Position:
@@ -74,11 +77,20 @@ def position_from_utg_distance(utg_distance: int, total_players: int) -> Positio
 
     This is the same logic as the old ``_get_position_name`` in cli.py.
     """
-    if utg_distance < 0 or utg_distance >= total_players:
-        raise ValueError(
-            f"utg_distance must be 0..{total_players - 1}, got {utg_distance}"
-        )
-
+    # Negative indexes would wrap, so only those need checking up front;
+    # the tuple lookup bounds-checks the rest
+    if utg_distance >= 0 and total_players >= 0:
+        try:
+            return _POS_TABLE[total_players][utg_distance]
+        except IndexError:
+            if utg_distance < total_players:  # more than MAX_SEATS players
+                return _compute_position(utg_distance, total_players)
+    raise ValueError(
+        f"utg_distance must be 0..{total_players - 1}, got {utg_distance}"
+    )
+
+
+def _compute_position(utg_distance: int, total_players: int) -> Position:
     # Count from the end
     from_end = total_players - 1 - utg_distance
 
@@ -99,3 +111,9 @@ def position_from_utg_distance(utg_distance: int, total_players: int) -> Positio
     if utg_distance == 1:
         return Position.UTG_1
     return Position.MP
+
+
+# _POS_TABLE[total_players][utg_distance]
+_POS_TABLE: tuple[tuple[Position, ...], ...] = tuple(
+    tuple(_compute_position(d, n) for d in range(n)) for n in range(MAX_SEATS + 1)
+)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from .player import Player
 
@@ -13,6 +15,17 @@ class SidePot:
 
     amount: int
     eligible_players: list[Player]
+    # Bit ``seat`` is set for each eligible player
+    eligible_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        mask = 0
+        for p in self.eligible_players:
+            mask |= 1 << p.seat
+        self.eligible_mask = mask
+
+    def is_eligible(self, player: Player) -> bool:
+        return bool(self.eligible_mask >> player.seat & 1)
 
 
 @dataclass
@@ -39,7 +52,7 @@ class PotManager:
 
         Algorithm:
         1. Collect all unique total_bet_this_hand values, sorted ascending
-        2. For each level, each contributor puts in min(their_bet, level) - prev_level
+        2. Each player who bet at least the level puts in level - prev_level
         3. Eligible = non-folded players whose bet >= that level
         4. Folded players' chips stay in the pot but they can't win it
         """
@@ -47,27 +60,49 @@ class PotManager:
         if not in_hand:
             return []
 
-        bet_levels = sorted({p.total_bet_this_hand for p in in_hand})
-        pots: list[SidePot] = []
-        prev_level = 0
-
-        for level in bet_levels:
-            pot_amount = 0
-            for p in in_hand:
-                contribution = min(p.total_bet_this_hand, level) - min(
-                    p.total_bet_this_hand, prev_level
-                )
-                pot_amount += contribution
-
-            eligible = [
-                p
-                for p in in_hand
-                if not p.is_folded and p.total_bet_this_hand >= level
-            ]
-
-            if pot_amount > 0:
-                pots.append(SidePot(amount=pot_amount, eligible_players=eligible))
-
-            prev_level = level
-
-        return pots
+        shape = _side_pot_shape(
+            tuple(p.total_bet_this_hand for p in in_hand),
+            tuple(p.is_folded for p in in_hand),
+        )
+        return [
+            SidePot(amount=amount, eligible_players=[in_hand[i] for i in eligible])
+            for amount, eligible in shape
+        ]
+
+
+@lru_cache(maxsize=1024)
+def _side_pot_shape(
+    bets: tuple[int, ...], folded: tuple[bool, ...]
+) -> tuple[tuple[int, tuple[int, ...]], ...]:
+    """Return ``(amount, eligible indices)`` per pot for one betting pattern.
+
+    Hands often end on the same bets (everyone calling the big blind, say),
+    so the shape is cached and only mapped back to players per call.
+    """
+    return tuple(
+        (
+            amount,
+            tuple(
+                i
+                for i, bet in enumerate(bets)
+                if not folded[i] and bet >= level
+            ),
+        )
+        for level, amount in _side_pot_core(list(bets))
+    )
+
+
+def _side_pot_core(bets: list[int]) -> list[tuple[int, int]]:
+    """Return ``(level, amount)`` for each distinct positive bet level.
+
+    Everyone who bet at least ``level`` pays the full increment to it, so
+    each pot is the increment times the number of such players.
+    """
+    bets = sorted(bets)
+    levels: list[tuple[int, int]] = []
+    prev_level = 0
+    for level in sorted(set(bets)):
+        contributors = len(bets) - bisect_left(bets, level)
+        levels.append((level, (level - prev_level) * contributors))
+        prev_level = level
+    return levels
@@ -8,7 +8,9 @@ Each tier is a set of canonical hand keys:
 Tiers are cumulative — _STRONG is a superset of _PREMIUM.
 """
 
-from .card import Card
+from functools import lru_cache
+
+from .card import Card, Rank, Suit
 from .position import Position
 
 
@@ -34,8 +36,44 @@ def hand_key(rank1_symbol: str, rank2_symbol: str, suited: bool) -> str:
 
 def hole_cards_to_key(card1: Card, card2: Card) -> str:
     """Convert two Card objects into a canonical range key."""
-    suited = card1.suit == card2.suit
-    return hand_key(card1.rank.symbol, card2.rank.symbol, suited)
+    high, low = card1.rank, card2.rank
+    if high < low:
+        high, low = low, high
+    # Suits don't matter for pairs, so there are only 169 distinct keys
+    return _key(high, low, high != low and card1.suit == card2.suit)
+
+
+@lru_cache(maxsize=169)
+def _key(high: Rank, low: Rank, suited: bool) -> str:
+    return hand_key(high.symbol, low.symbol, suited)
+
+
+def key_to_hole_cards(key: str) -> list[Card]:
+    """Convert a hand key like 'AKs' to two representative Card objects."""
+    if len(key) == 2:
+        r = _rank_from_char(key[0])
+        return [Card(r, Suit.SPADES), Card(r, Suit.HEARTS)]
+    elif len(key) == 3:
+        r1 = _rank_from_char(key[0])
+        r2 = _rank_from_char(key[1])
+        if key[2] == "s":
+            return [Card(r1, Suit.SPADES), Card(r2, Suit.SPADES)]
+        else:
+            return [Card(r1, Suit.SPADES), Card(r2, Suit.HEARTS)]
+    raise ValueError(f"Invalid hand key: {key}")
+
+
+def _rank_from_char(c: str) -> Rank:
+    """Convert a single character to a Rank."""
+    rank_map = {
+        "A": Rank.ACE, "K": Rank.KING, "Q": Rank.QUEEN, "J": Rank.JACK,
+        "T": Rank.TEN, "9": Rank.NINE, "8": Rank.EIGHT, "7": Rank.SEVEN,
+        "6": Rank.SIX, "5": Rank.FIVE, "4": Rank.FOUR, "3": Rank.THREE,
+        "2": Rank.TWO,
+    }
+    if c not in rank_map:
+        raise ValueError(f"Invalid rank character: {c}")
+    return rank_map[c]
 
 
 # ── Range tiers ─────────────────────────────────────────────
@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import random
+import re
 import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from types import ModuleType
+
+readline: ModuleType | None
+try:
+    import readline
+except ImportError:  # Windows without pyreadline3
+    readline = None
 
 from rich.columns import Columns
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.status import Status
 from .action import Action, ActionType
 from .ai_bot import AiBotConfig, AiDebugInfo
 from .bot import BotConfig
@@ -29,13 +40,23 @@ HAND_END_DELAY = 3.0
 
 console = Console()
 
+# Output piped to a file or another process: skip the full-screen redraws,
+# spinners and pacing, and print each log entry as a plain line instead.
+HEADLESS = not console.is_terminal
+
+# Panels reused across redraws; rendering only swaps their contents.
+_header_panel = Panel("", style="blue", expand=True)
+_board_panel = Panel("", title="Board", expand=False)
+_log_panel = Panel("", title="Action", border_style="dim", expand=True)
+
 
 def _clear() -> None:
     console.clear()
 
 
 def _pause(seconds: float) -> None:
-    time.sleep(seconds)
+    if not HEADLESS:
+        time.sleep(seconds)
 
 
 def _format_card(c: Card) -> str:
@@ -45,36 +66,87 @@ def _format_card(c: Card) -> str:
     return f"[bold white]{symbol}[/bold white]"
 
 
-def _format_cards(cards: list[Card]) -> str:
+def _format_cards(cards: Sequence[Card]) -> str:
     return " ".join(_format_card(c) for c in cards)
 
 
-def _generate_bot_personalities(names: list[str], seed: int = 42) -> dict[str, BotConfig]:
-    """Generate diverse bot personalities with seeded randomness."""
+class _Cards(tuple[Card, ...]):
+    """Cards in a log entry, formatted as markup only when the entry is drawn."""
+
+    __slots__ = ()
+
+    def __format__(self, spec: str) -> str:
+        return _format_cards(self)
+
+
+# A log entry is a str.format template plus its arguments.  Entries are
+# cheap to append; only the visible tail is ever formatted.
+LogEntry = tuple[str, tuple]
+
+_ACTION_TEMPLATES = {
+    ActionType.FOLD: "[dim]{0}{1} folds[/dim]",
+    ActionType.CHECK: "[yellow]{0}{1} checks[/yellow]",
+    ActionType.CALL: "[yellow]{0}{1} calls[/yellow]",
+    ActionType.RAISE: "[green]{0}{1} raises to {2}[/green]",
+    ActionType.ALL_IN: "[bold red]{0}{1} ALL IN ({2})[/bold red]",
+}
+
+
+# (aggression, bluff_frequency, tightness, raise_sizing)
+_BOT_PRESETS = (
+    (0.8, 0.25, 0.3, 3.0),   # aggressive, loose
+    (0.3, 0.05, 0.8, 2.5),   # passive, tight
+    (0.6, 0.15, 0.5, 2.5),   # balanced TAG
+    (0.9, 0.30, 0.2, 3.5),   # maniac
+    (0.4, 0.10, 0.7, 2.0),   # tight-passive (rock)
+    (0.7, 0.20, 0.4, 2.8),   # loose-aggressive
+    (0.5, 0.12, 0.6, 2.3),   # slightly tight TAG
+)
+
+
+def _clamp(value: float, lo: float, hi: float) -> float:
+    return max(lo, min(hi, value))
+
+
+def _sample_personality_rows(
+    n: int, seed: int = 42
+) -> list[tuple[float, float, float, float, int]]:
+    """Sample ``n`` rows of (aggression, bluff, tightness, sizing, seed).
+
+    This is the numeric core of `_generate_bot_personalities`, kept free of
+    object construction so seed sweeps can call it directly.
+    """
     rng = random.Random(seed)
-    personalities: dict[str, BotConfig] = {}
-
-    presets = [
-        (0.8, 0.25, 0.3, 3.0),   # aggressive, loose
-        (0.3, 0.05, 0.8, 2.5),   # passive, tight
-        (0.6, 0.15, 0.5, 2.5),   # balanced TAG
-        (0.9, 0.30, 0.2, 3.5),   # maniac
-        (0.4, 0.10, 0.7, 2.0),   # tight-passive (rock)
-        (0.7, 0.20, 0.4, 2.8),   # loose-aggressive
-        (0.5, 0.12, 0.6, 2.3),   # slightly tight TAG
-    ]
+    gauss = rng.gauss
+    randint = rng.randint
+    rows: list[tuple[float, float, float, float, int]] = []
 
-    for i, name in enumerate(names):
-        preset = presets[i % len(presets)]
-        personalities[name] = BotConfig(
-            aggression=max(0.0, min(1.0, preset[0] + rng.gauss(0, 0.05))),
-            bluff_frequency=max(0.0, min(0.5, preset[1] + rng.gauss(0, 0.02))),
-            tightness=max(0.0, min(1.0, preset[2] + rng.gauss(0, 0.05))),
-            raise_sizing=max(2.0, preset[3] + rng.gauss(0, 0.2)),
-            seed=rng.randint(0, 2**31),
-        )
+    for i in range(n):
+        aggression, bluff, tightness, sizing = _BOT_PRESETS[i % len(_BOT_PRESETS)]
+        rows.append((
+            _clamp(aggression + gauss(0, 0.05), 0.0, 1.0),
+            _clamp(bluff + gauss(0, 0.02), 0.0, 0.5),
+            _clamp(tightness + gauss(0, 0.05), 0.0, 1.0),
+            max(2.0, sizing + gauss(0, 0.2)),
+            randint(0, 2**31),
+        ))
 
-    return personalities
+    return rows
+
+
+def _generate_bot_personalities(names: list[str], seed: int = 42) -> dict[str, BotConfig]:
+    """Generate diverse bot personalities with seeded randomness."""
+    rows = _sample_personality_rows(len(names), seed)
+    return {
+        name: BotConfig(
+            aggression=aggression,
+            bluff_frequency=bluff,
+            tightness=tightness,
+            raise_sizing=sizing,
+            seed=bot_seed,
+        )
+        for name, (aggression, bluff, tightness, sizing, bot_seed) in zip(names, rows)
+    }
 
 
 def _render_header(
@@ -90,77 +162,144 @@ def _render_header(
     right = f"Players {num_alive}/{total_players}"
     pot_str = f"Pot: {pot_total:,}" if pot_total > 0 else ""
 
-    console.print(
-        Panel(
-            f"[bold]{left}[/bold]  |  {mid}  |  {pot_str}  |  {right}",
-            style="blue",
-            expand=True,
+    _header_panel.renderable = f"[bold]{left}[/bold]  |  {mid}  |  {pot_str}  |  {right}"
+    console.print(_header_panel)
+
+
+@dataclass(frozen=True)
+class PlayerDisplay:
+    """Pre-formatted markup for one player.
+
+    Names don't change during a tournament, so these strings are built once
+    at setup.  The seat name line only differs by the dealer marker, so both
+    variants are kept.
+    """
+
+    label: str
+    ai_tag: str
+    name_with_dealer: str
+    name_without_dealer: str
+
+    @classmethod
+    def for_player(cls, p: Player, is_ai: bool = False) -> PlayerDisplay:
+        name_color = "bold cyan" if p.is_human else "white"
+        name = f"[{name_color}]{p.name}[/{name_color}]"
+        return cls(
+            label="[bold cyan]You[/bold cyan]" if p.is_human else p.name,
+            ai_tag=" [magenta](AI)[/magenta]" if is_ai else "",
+            name_with_dealer=f"[yellow]D[/yellow] {name}",
+            name_without_dealer=f"  {name}",
         )
-    )
+
+    def name_line(self, is_dealer: bool) -> str:
+        return self.name_with_dealer if is_dealer else self.name_without_dealer
+
+
+@dataclass
+class _SeatCache:
+    """Seat panels from the previous redraw, reused while a seat is unchanged.
+
+    Each seat keeps only its latest ``(state_key, panel)`` pair, so the cache
+    is bounded by the number of seats.  ``columns`` is reused as long as the
+    ordered panel identities are the same.
+    """
+
+    panels: dict[int, tuple[tuple, Panel]] = field(default_factory=dict)
+    columns_key: tuple[int, ...] = ()
+    columns: Columns | None = None
+
+
+def _build_seat_panel(
+    p: Player, is_dealer: bool, display: PlayerDisplay | None = None
+) -> Panel:
+    """Build the panel for a single seat."""
+    # Name line
+    if display is None:
+        display = PlayerDisplay.for_player(p)
+    name_line = display.name_line(is_dealer)
+
+    # Cards
+    if p.is_human and p.hole_cards:
+        card_line = _format_cards(p.hole_cards)
+    elif p.hole_cards and not p.is_folded:
+        card_line = "[dim]\u2588\u2588 \u2588\u2588[/dim]"
+    else:
+        card_line = "    "
+
+    # Chips
+    chip_line = f"[green]{p.chips:,}[/green]" if p.chips > 0 else "[red]0[/red]"
+
+    # Status
+    if p.is_folded:
+        border = "dim"
+        status = "[dim]Folded[/dim]"
+    elif p.is_all_in:
+        border = "red"
+        status = "[bold red]ALL IN[/bold red]"
+    else:
+        border = "green" if p.is_human else "white"
+        status = ""
+
+    body = f"{name_line}\n{card_line}\n{chip_line}"
+    if status:
+        body += f"\n{status}"
+
+    return Panel(body, border_style=border, width=16, height=6)
 
 
 def _render_seats(
     players: list[Player],
     dealer_seat: int,
     community: list[Card] | None = None,
+    cache: _SeatCache | None = None,
+    displays: dict[str, PlayerDisplay] | None = None,
 ) -> None:
-    """Render player seats as a compact grid."""
+    """Render player seats as a compact grid.
+
+    When a cache is given, seats whose visible state hasn't changed since
+    the last redraw reuse their previous panel.
+    """
+    if cache is None:
+        cache = _SeatCache()
     seat_panels: list[Panel] = []
 
     for p in players:
         if p.is_eliminated:
             continue
 
-        # Name line
-        marker = "[yellow]D[/yellow] " if p.seat == dealer_seat else "  "
-        name_color = "bold cyan" if p.is_human else "white"
-        name_line = f"{marker}[{name_color}]{p.name}[/{name_color}]"
-
-        # Cards
-        if p.is_human and p.hole_cards:
-            card_line = _format_cards(p.hole_cards)
-        elif p.hole_cards and not p.is_folded:
-            card_line = "[dim]\u2588\u2588 \u2588\u2588[/dim]"
-        else:
-            card_line = "    "
-
-        # Chips
-        chip_line = f"[green]{p.chips:,}[/green]" if p.chips > 0 else "[red]0[/red]"
-
-        # Status
-        if p.is_folded:
-            border = "dim"
-            status = "[dim]Folded[/dim]"
-        elif p.is_all_in:
-            border = "red"
-            status = "[bold red]ALL IN[/bold red]"
+        is_dealer = p.seat == dealer_seat
+        key = (p.chips, p.is_folded, p.is_all_in, p.hole_cards, is_dealer)
+        cached = cache.panels.get(p.seat)
+        if cached is not None and cached[0] == key:
+            panel = cached[1]
         else:
-            border = "green" if p.is_human else "white"
-            status = ""
-
-        body = f"{name_line}\n{card_line}\n{chip_line}"
-        if status:
-            body += f"\n{status}"
+            display = displays.get(p.name) if displays else None
+            panel = _build_seat_panel(p, is_dealer, display)
+            cache.panels[p.seat] = (key, panel)
+        seat_panels.append(panel)
 
-        seat_panels.append(Panel(body, border_style=border, width=16, height=6))
-
-    console.print(Columns(seat_panels, equal=True, expand=True))
+    columns_key = tuple(id(panel) for panel in seat_panels)
+    if cache.columns is None or columns_key != cache.columns_key:
+        cache.columns = Columns(seat_panels, equal=True, expand=True)
+        cache.columns_key = columns_key
+    console.print(cache.columns)
 
     if community:
-        board_str = _format_cards(community)
-        console.print(Panel(f"  {board_str}  ", title="Board", expand=False), justify="center")
+        _board_panel.renderable = f"  {_format_cards(community)}  "
+        console.print(_board_panel, justify="center")
 
 
 def _render_action_log(
-    log: list[str],
+    log: list[LogEntry],
     max_lines: int = 8,
 ) -> None:
     """Show recent actions."""
     if not log:
         return
     recent = log[-max_lines:]
-    body = "\n".join(recent)
-    console.print(Panel(body, title="Action", border_style="dim", expand=True, height=min(len(recent) + 2, max_lines + 2)))
+    _log_panel.renderable = "\n".join(template.format(*args) for template, args in recent)
+    _log_panel.height = min(len(recent) + 2, max_lines + 2)
+    console.print(_log_panel)
 
 
 def _redraw(
@@ -170,17 +309,75 @@ def _redraw(
     pot_total: int,
     dealer_seat: int,
     community: list[Card] | None,
-    action_log: list[str],
+    action_log: list[LogEntry],
     total_players: int,
+    seat_cache: _SeatCache | None = None,
+    displays: dict[str, PlayerDisplay] | None = None,
 ) -> None:
     """Full screen redraw."""
     _clear()
     num_alive = sum(1 for p in players if not p.is_eliminated)
     _render_header(hand_number, blind_level, pot_total, num_alive, total_players)
-    _render_seats(players, dealer_seat, community)
+    _render_seats(players, dealer_seat, community, seat_cache, displays)
     _render_action_log(action_log)
 
 
+_COMMANDS = ("check", "call", "fold", "raise", "allin")
+
+
+def _poker_completer(text: str, state: int) -> str | None:
+    """Readline completer for action words."""
+    matches = [c for c in _COMMANDS if c.startswith(text)]
+    return matches[state] if state < len(matches) else None
+
+
+def _setup_readline() -> None:
+    """Enable tab completion and keep history to accepted actions only.
+
+    Rich's prompt reads through ``input()``, so with readline loaded the
+    up arrow recalls earlier actions, e.g. the last raise.
+    """
+    if readline is None:
+        return
+    readline.set_completer(_poker_completer)
+    readline.parse_and_bind("tab: complete")
+    readline.set_auto_history(False)
+
+
+def _remember(response: str) -> None:
+    if readline is not None:
+        readline.add_history(response)
+
+
+# "r 250" / "raise250" raise to an amount; "+50", "2x" and "pot" work with or
+# without the raise word in front.
+_RAISE_RE = re.compile(r"^(?:r(?:aise)?\s*(\d+)|(?:r(?:aise)?\s*)?(\+\d+|\d+x|pot))$")
+_RAISE_WORDS = frozenset({"r", "raise"})
+
+
+def _parse_raise(response: str, ctx: PlayerActionContext) -> int | None:
+    """Parse a one-line raise command into a raise-to amount.
+
+    Relative sizes are measured from the bet being faced: ``+N`` raises by N,
+    ``Nx`` raises to N times the bet (or N times the minimum raise when
+    unopened), and ``pot`` makes a pot-sized raise.  Returns None when the
+    response isn't a complete raise command.
+    """
+    m = _RAISE_RE.match(response)
+    if m is None:
+        return None
+    absolute, relative = m.groups()
+    if absolute is not None:
+        return int(absolute)
+
+    facing = ctx.current_bet + ctx.to_call
+    if relative == "pot":
+        return facing + ctx.pot_total + ctx.to_call
+    if relative[0] == "+":
+        return facing + int(relative[1:])
+    return int(relative[:-1]) * (facing or ctx.min_raise)
+
+
 def prompt_human_action(player: Player, ctx: PlayerActionContext) -> Action:
     """Prompt the human player for their action."""
     console.print()
@@ -202,44 +399,50 @@ def prompt_human_action(player: Player, ctx: PlayerActionContext) -> Action:
         response = Prompt.ask("  [bold cyan]>>>[/bold cyan]").strip().lower()
 
         if response in ("c", "check") and ctx.to_call == 0:
+            _remember(response)
             return Action(ActionType.CHECK)
 
         if response in ("c", "call") and ctx.to_call > 0:
+            _remember(response)
             return Action(ActionType.CALL)
 
         if response in ("f", "fold"):
             if ctx.to_call == 0:
                 console.print("  [yellow]You can check for free![/yellow]")
                 continue
+            _remember(response)
             return Action(ActionType.FOLD)
 
         if response in ("a", "all-in", "allin", "all"):
+            _remember(response)
             return Action(ActionType.ALL_IN, player.chips + player.current_bet)
 
-        if response.startswith("r") or response.startswith("raise"):
-            parts = response.split()
-            if len(parts) >= 2:
-                try:
-                    raise_to = int(parts[1])
-                except ValueError:
-                    console.print("  [red]Invalid raise amount[/red]")
-                    continue
-            else:
-                try:
-                    raise_to = int(Prompt.ask("  [bold]Raise to[/bold]"))
-                except ValueError:
-                    console.print("  [red]Invalid amount[/red]")
-                    continue
-
-            if raise_to < ctx.min_raise:
-                console.print(f"  [red]Minimum raise is {ctx.min_raise}[/red]")
+        raise_to = _parse_raise(response, ctx)
+        if raise_to is None and response in _RAISE_WORDS:
+            # Bare raise word: ask for the amount on a second line
+            try:
+                raise_to = int(Prompt.ask("  [bold]Raise to[/bold]"))
+            except ValueError:
+                console.print("  [red]Invalid amount[/red]")
                 continue
-            if raise_to > ctx.max_raise:
-                console.print(f"  [yellow]Capped to all-in ({ctx.max_raise})[/yellow]")
-                return Action(ActionType.ALL_IN, ctx.max_raise)
-            return Action(ActionType.RAISE, raise_to)
+            # Record it as one line so recalling it skips this prompt
+            response = f"r {raise_to}"
+        if raise_to is None and _RAISE_WORDS.intersection(response.split()[:1]):
+            console.print("  [red]Invalid raise amount[/red]")
+            continue
 
-        console.print("  [red]Invalid action. Use c/f/r/a[/red]")
+        if raise_to is None:
+            console.print("  [red]Invalid action. Use c/f/r/a[/red]")
+            continue
+
+        if raise_to < ctx.min_raise:
+            console.print(f"  [red]Minimum raise is {ctx.min_raise}[/red]")
+            continue
+        _remember(response)
+        if raise_to > ctx.max_raise:
+            console.print(f"  [yellow]Capped to all-in ({ctx.max_raise})[/yellow]")
+            return Action(ActionType.ALL_IN, ctx.max_raise)
+        return Action(ActionType.RAISE, raise_to)
 
 
 AI_PERSONAS = [
@@ -287,6 +490,7 @@ def run_tournament_cli(
         debug: Show AI prompt/response debug info.
     """
     ai_opponents = max(0, min(ai_opponents, num_bots))
+    _setup_readline()
 
     _clear()
     mode_label = f"{ai_opponents} AI ({ai_model})" if ai_opponents else "rule-based"
@@ -296,7 +500,7 @@ def run_tournament_cli(
         Panel(
             "[bold]Texas Hold'em Tournament[/bold]\n"
             f"You vs {num_bots} opponents ({mode_label})  |  Starting stack: {starting_stack:,}\n"
-            "[dim]Actions: c(heck/all) | f(old) | r(aise) N | a(ll-in)[/dim]",
+            "[dim]Actions: c(heck/all) | f(old) | r(aise) N, +N, Nx, pot | a(ll-in)[/dim]",
             expand=False,
             border_style="green",
         )
@@ -312,6 +516,7 @@ def run_tournament_cli(
 
     rule_personalities = _generate_bot_personalities(rule_names) if rule_names else {}
     ai_personalities = _generate_ai_personalities(ai_names, ai_model) if ai_names else {}
+    ai_name_set = frozenset(ai_personalities)
 
     players: list[Player] = []
     players.append(Player(name="You", chips=starting_stack, seat=0, is_human=True))
@@ -319,6 +524,9 @@ def run_tournament_cli(
         players.append(Player(name=name, chips=starting_stack, seat=i + 1))
 
     total_players = len(players)
+    displays = {
+        p.name: PlayerDisplay.for_player(p, p.name in ai_name_set) for p in players
+    }
 
     config = TournamentConfig(
         num_bots=num_bots,
@@ -327,22 +535,64 @@ def run_tournament_cli(
     )
 
     # Mutable state for callbacks
-    action_log: list[str] = []
+    action_log: list[LogEntry] = []
     current_community: list[Card] = []
     current_blind_level = config.blind_schedule[0]
     current_hand_number = 0
     current_dealer_seat = 0
     current_pot = 0
+    bets_seen: dict[str, int] = {}  # total_bet_this_hand at the last update
     human_in_hand = True
+    seat_cache = _SeatCache()
+    # Alive players, best stack first.  Stacks move only a little per hand,
+    # so re-sorting this in place is close to a single pass.
+    standings = list(players)
+    alive_players: list[Player] = list(players)  # rebuilt each hand
+    thinking: Status | None = None  # spinner shown while an AI decides
+
+    def _log(template: str, *args: object) -> None:
+        if HEADLESS:
+            console.print(template.format(*args))
+        else:
+            action_log.append((template, args))
 
     def _redraw_current() -> None:
         _redraw(
             players, current_hand_number, current_blind_level,
             current_pot, current_dealer_seat,
             current_community if current_community else None,
-            action_log, total_players,
+            action_log, total_players, seat_cache, displays,
         )
 
+    # Callbacks only mark the screen dirty; it is redrawn once at the next
+    # sync point (a pause or a prompt) instead of after every event.
+    dirty = True
+
+    def _mark_dirty() -> None:
+        nonlocal dirty
+        dirty = True
+
+    def _flush() -> None:
+        nonlocal dirty
+        if dirty:
+            dirty = False
+            if not HEADLESS:
+                _redraw_current()
+
+    def _wait(seconds: float) -> None:
+        _flush()
+        _pause(seconds)
+
+    def _prompt_human(player: Player, ctx: PlayerActionContext) -> Action:
+        _flush()
+        return prompt_human_action(player, ctx)
+
+    def _stop_thinking() -> None:
+        nonlocal thinking
+        if thinking is not None:
+            thinking.stop()
+            thinking = None
+
     def on_hand_start(hand_num: int, level: BlindLevel, dealer: int) -> None:
         nonlocal current_community, current_blind_level, current_hand_number
         nonlocal current_dealer_seat, current_pot, human_in_hand
@@ -351,107 +601,104 @@ def run_tournament_cli(
         current_hand_number = hand_num
         current_dealer_seat = dealer
         current_pot = 0
+        bets_seen.clear()
         action_log.clear()
-        human_in_hand = any(p.is_human and not p.is_eliminated for p in players)
-        _redraw_current()
+        alive_players[:] = [p for p in players if not p.is_eliminated]
+        human_in_hand = any(p.is_human for p in alive_players)
+        _mark_dirty()
 
     def on_deal(street: str, community: list[Card]) -> None:
-        nonlocal current_community
+        nonlocal current_community, current_pot
         if community:
             current_community = community
 
         if street == "hole_cards":
-            action_log.append("[bold]Cards dealt[/bold]")
+            _log("[bold]Cards dealt[/bold]")
+            if HEADLESS:
+                # No seat panels are drawn, so the human's cards go in the log
+                for p in alive_players:
+                    if p.is_human and p.hole_cards:
+                        _log("  {0}: {1}", p.name, _Cards(p.hole_cards))
+            # Blinds are posted without an action callback, so take the
+            # starting pot from the bets once; actions update it after that.
+            current_pot = _sync_pot()
+            for p in players:
+                bets_seen[p.name] = p.total_bet_this_hand
         elif street in ("flop", "turn", "river"):
-            action_log.append(f"[bold cyan]── {street.capitalize()} ──  {_format_cards(community)}[/bold cyan]")
-            _pause(STREET_DELAY)
+            _log("[bold cyan]── {0} ──  {1}[/bold cyan]", street.capitalize(), _Cards(community))
 
-        # Update pot from player bets
-        _sync_pot()
-        _redraw_current()
+        _mark_dirty()
+        if street != "hole_cards":
+            _wait(STREET_DELAY)
 
-    def _sync_pot() -> None:
-        nonlocal current_pot
-        current_pot = sum(p.total_bet_this_hand for p in players if not p.is_eliminated)
+    def _sync_pot() -> int:
+        """Recompute the pot from every player's bets this hand."""
+        total = 0
+        for p in alive_players:
+            total += p.total_bet_this_hand
+        return total
 
     def on_action(player: Player, action: Action) -> None:
-        # Remove thinking indicator if present
-        if action_log and action_log[-1].endswith("is thinking..."):
-            action_log.pop()
-
-        color = {
-            ActionType.FOLD: "dim",
-            ActionType.CHECK: "yellow",
-            ActionType.CALL: "yellow",
-            ActionType.RAISE: "green",
-            ActionType.ALL_IN: "bold red",
-        }.get(action.type, "white")
-
-        if action.type == ActionType.RAISE:
-            text = f"raises to {int(action.amount)}"
-        elif action.type == ActionType.ALL_IN:
-            text = f"ALL IN ({int(action.amount)})"
-        elif action.type == ActionType.CALL:
-            text = "calls"
-        elif action.type == ActionType.CHECK:
-            text = "checks"
-        else:
-            text = "folds"
+        nonlocal current_pot
+        _stop_thinking()
 
-        is_ai = player.name in ai_personalities
-        label = "[bold cyan]You[/bold cyan]" if player.is_human else player.name
-        ai_tag = " [magenta](AI)[/magenta]" if is_ai else ""
-        action_log.append(f"[{color}]{label}{ai_tag} {text}[/{color}]")
+        display = displays[player.name]
+        _log(
+            _ACTION_TEMPLATES[action.type],
+            display.label, display.ai_tag, int(action.amount),
+        )
 
-        _sync_pot()
-        _redraw_current()
+        bet = player.total_bet_this_hand
+        current_pot += bet - bets_seen.get(player.name, 0)
+        bets_seen[player.name] = bet
+        if debug:
+            assert current_pot == _sync_pot(), "incremental pot drifted"
+        _mark_dirty()
 
         if not player.is_human:
-            _pause(ACTION_DELAY)
+            _wait(ACTION_DELAY)
 
     def on_showdown(
         pot_winners: list[tuple[SidePot, list[Player], HandValue | None]],
     ) -> None:
-        _pause(SHOWDOWN_DELAY)
-        action_log.append("")
+        _wait(SHOWDOWN_DELAY)
+        _log("")
 
         # Reveal bot hands
         for p in players:
             if p.is_in_hand and not p.is_human and p.hole_cards:
-                action_log.append(f"  {p.name}: {_format_cards(p.hole_cards)}")
+                _log("  {0}: {1}", p.name, _Cards(p.hole_cards))
 
-        action_log.append("")
+        _log("")
         for sp, winners, hand_value in pot_winners:
-            names = ", ".join(
-                "[bold cyan]You[/bold cyan]" if w.is_human else w.name
-                for w in winners
-            )
-            hand_str = f" with [bold]{hand_value}[/bold]" if hand_value else ""
-            action_log.append(f"[bold green]{names} wins {sp.amount:,}{hand_str}[/bold green]")
+            names = ", ".join(displays[w.name].label for w in winners)
+            if hand_value:
+                _log("[bold green]{0} wins {1:,} with [bold]{2}[/bold][/bold green]", names, sp.amount, hand_value)
+            else:
+                _log("[bold green]{0} wins {1:,}[/bold green]", names, sp.amount)
 
-        _redraw_current()
-        _pause(SHOWDOWN_DELAY)
+        _mark_dirty()
+        _wait(SHOWDOWN_DELAY)
 
     def on_hand_end(result: HandResult) -> None:
         # Brief chip leaderboard
-        alive = sorted(
-            [p for p in players if not p.is_eliminated],
-            key=lambda p: p.chips,
-            reverse=True,
-        )
-        action_log.append("")
-        for i, p in enumerate(alive):
+        standings.sort(key=lambda p: (-p.chips, p.seat))
+        _log("")
+        for i, p in enumerate(standings):
             marker = " [bold cyan]*[/bold cyan]" if p.is_human else ""
-            action_log.append(f"  {i + 1}. {p.name}: {p.chips:,}{marker}")
+            _log("  {0}. {1}: {2:,}{3}", i + 1, p.name, p.chips, marker)
 
-        _redraw_current()
-        _pause(HAND_END_DELAY)
+        _mark_dirty()
+        _wait(HAND_END_DELAY)
 
     def on_elimination(player: Player, place: int) -> None:
         suffix = {1: "st", 2: "nd", 3: "rd"}.get(place, "th")
-        action_log.append(f"[bold red]{player.name} eliminated in {place}{suffix} place![/bold red]")
-        _redraw_current()
-        _pause(HAND_END_DELAY)
+        _log("[bold red]{0} eliminated in {1}{2} place![/bold red]", player.name, place, suffix)
+        seat_cache.panels.pop(player.seat, None)
+        standings.remove(player)
+        alive_players.remove(player)
+        _mark_dirty()
+        _wait(HAND_END_DELAY)
 
         if player.is_human:
             console.print()
@@ -464,11 +711,12 @@ def run_tournament_cli(
             _pause(2.0)
 
     def on_blind_increase(level: BlindLevel, idx: int) -> None:
-        action_log.append(
-            f"[bold yellow]Blinds increase to {level.small_blind}/{level.big_blind}![/bold yellow]"
+        _log(
+            "[bold yellow]Blinds increase to {0}/{1}![/bold yellow]",
+            level.small_blind, level.big_blind,
         )
-        _redraw_current()
-        _pause(1.0)
+        _mark_dirty()
+        _wait(1.0)
 
     def on_tournament_end(winner: Player) -> None:
         _clear()
@@ -493,13 +741,20 @@ def run_tournament_cli(
             )
 
     def on_before_action(player: Player) -> None:
-        if player.name in ai_personalities and not player.is_human:
-            action_log.append(f"[magenta]{player.name} is thinking...[/magenta]")
-            _redraw_current()
+        nonlocal thinking
+        if player.name in ai_name_set and not player.is_human and not HEADLESS:
+            # The AI call blocks this thread; draw the table first, then let
+            # Rich's refresh thread animate a spinner until the action lands.
+            _flush()
+            thinking = console.status(
+                f"[magenta]{player.name} is thinking...[/magenta]", spinner="dots"
+            )
+            thinking.start()
 
     def on_ai_debug(player: Player, info: AiDebugInfo, reasoning: str) -> None:
         if not debug:
             return
+        _stop_thinking()
         decision = info.parsed_decision
         action = decision.get("action", "?") if decision else "?"
         amount = decision.get("amount", 0) if decision else 0
@@ -510,6 +765,7 @@ def run_tournament_cli(
             lines.append(f"[red]Error: {info.error}[/red]")
         lines.append(f"[dim]{reasoning}[/dim]")
 
+        _flush()
         console.print(Panel("\n".join(lines), border_style="magenta", expand=False))
         Prompt.ask("[dim]Enter[/dim]")
 
@@ -518,7 +774,7 @@ def run_tournament_cli(
         players=players,
         bot_configs=rule_personalities,
         ai_bot_configs=ai_personalities,
-        get_human_action=prompt_human_action,
+        get_human_action=_prompt_human,
         on_hand_start=on_hand_start,
         on_hand_end=on_hand_end,
         on_elimination=on_elimination,
@@ -534,4 +790,5 @@ def run_tournament_cli(
     try:
         tournament.run()
     except KeyboardInterrupt:
+        _stop_thinking()
         console.print("\n[dim]Tournament interrupted.[/dim]")
@@ -2,25 +2,25 @@
 
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Final
 
-from .action import Action, ActionType
+from .action import Action, ActionType, BotDecision
 from .ai_bot import AiBot, AiBotConfig, AiDebugInfo
 from .betting import BettingRound
-from .bot import Bot, BotConfig, GameState
+from .bot import BotConfig, GameState
 from .card import Card
 from .deck import Deck
-from .evaluator import PlayerHand, evaluate_game
-from .hand import HandValue
+from .hand import Hand, HandValue
 from .player import Player, PlayerActionContext
 from .position import Position, position_from_utg_distance
 from .pot import PotManager, SidePot
 
-STREETS = ["preflop", "flop", "turn", "river"]
+STREETS: Final = ("preflop", "flop", "turn", "river")
 
 
-@dataclass
+@dataclass(slots=True)
 class HandResult:
     """Outcome of a single hand."""
 
@@ -30,7 +30,121 @@ class HandResult:
     went_to_showdown: bool
 
 
-@dataclass
+@dataclass(slots=True)
+class _HandLayout:
+    """Seat order, blinds and positions for one hand.
+
+    ``positions`` drives the bots; ``labels`` holds the matching short names
+    for the action context.
+    """
+
+    rotated: list[Player]  # clockwise from the seat after the dealer
+    preflop_order: list[Player]
+    sb_player: Player
+    bb_player: Player
+    positions: dict[int, Position]
+    labels: dict[int, str]
+
+
+class _HandContext:
+    """Per-hand state behind the betting-round callbacks.
+
+    One is created per hand; ``street``, ``board`` and ``betting`` are
+    updated as each street starts, so the callbacks handed to
+    `BettingRound.run` are bound methods rather than closures rebuilt
+    every street.  ``betting`` is unset until the first street starts.
+    """
+
+    __slots__ = (
+        "action_ctx",
+        "any_all_in",
+        "betting",
+        "board",
+        "in_hand_count",
+        "labels",
+        "positions",
+        "pot",
+        "street",
+        "table",
+    )
+
+    table: Table
+    pot: PotManager
+    positions: dict[int, Position]
+    labels: dict[int, str]
+    street: str
+    board: tuple[Card, ...]
+    betting: BettingRound
+    in_hand_count: int
+    any_all_in: bool
+    action_ctx: PlayerActionContext
+
+    def __init__(
+        self,
+        table: Table,
+        pot: PotManager,
+        layout: _HandLayout,
+        in_hand_count: int,
+    ) -> None:
+        self.table = table
+        self.pot = pot
+        self.positions = layout.positions
+        self.labels = layout.labels
+        self.street = "preflop"
+        self.board = ()
+        # Players not folded, kept up to date as actions come in
+        self.in_hand_count = in_hand_count
+        # Whether anyone is all-in, counting blinds that took a whole stack
+        self.any_all_in = layout.sb_player.is_all_in or layout.bb_player.is_all_in
+        # Refilled by make_context for every decision
+        self.action_ctx = PlayerActionContext(
+            hole_cards=(),
+            community=(),
+            pot_total=0,
+            to_call=0,
+            min_raise=0,
+            max_raise=0,
+            current_bet=0,
+            street=self.street,
+            num_active_players=in_hand_count,
+            position_label="?",
+        )
+
+    def make_context(self, player: Player) -> PlayerActionContext:
+        betting = self.betting
+        ctx = self.action_ctx
+        ctx.hole_cards = player.hole_cards
+        ctx.community = self.board
+        ctx.pot_total = self.pot.total
+        ctx.to_call = max(0, betting.current_bet - player.current_bet)
+        ctx.min_raise = betting.current_bet + betting.min_raise
+        ctx.max_raise = player.current_bet + player.chips
+        ctx.current_bet = player.current_bet
+        ctx.street = self.street
+        ctx.num_active_players = self.in_hand_count
+        ctx.position_label = self.labels.get(player.seat, "?")
+        return ctx
+
+    def get_action(self, player: Player, ctx: PlayerActionContext) -> Action:
+        table = self.table
+        if table.on_before_action:
+            table.on_before_action(player)
+        if player.is_human and table.get_human_action:
+            return table.get_human_action(player, ctx)
+        return table._get_bot_action(
+            player, ctx, self.street, self.board, self.positions
+        )
+
+    def on_action(self, player: Player, action: Action) -> None:
+        if action.type == ActionType.FOLD:
+            self.in_hand_count -= 1
+        elif player.is_all_in:
+            self.any_all_in = True
+        if self.table.on_action:
+            self.table.on_action(player, action)
+
+
+@dataclass(slots=True)
 class Table:
     """Orchestrates a single hand of Texas Hold'em."""
 
@@ -42,8 +156,16 @@ class Table:
     get_human_action: Callable[[Player, PlayerActionContext], Action] | None = None
     bot_configs: dict[str, BotConfig] = field(default_factory=dict)
     ai_bot_configs: dict[str, AiBotConfig] = field(default_factory=dict)
-    _bot_cache: dict[str, Bot] = field(default_factory=dict, repr=False)
+    _bot_fns: dict[str, Callable[[GameState], BotDecision]] = field(
+        default_factory=dict, repr=False
+    )
     _ai_bot_cache: dict[str, AiBot] = field(default_factory=dict, repr=False)
+    # Seat -> index into the alive seats (or the next one clockwise), and
+    # the seats it was built for
+    _seat_to_idx: list[int] = field(init=False, default_factory=list, repr=False)
+    _indexed_seats: tuple[int, ...] = field(init=False, default=(), repr=False)
+    rng: random.Random | None = None  # shuffles the deck; None = module random
+    deck: Deck | None = None  # reused across hands when given
 
     on_action: Callable[[Player, Action], None] | None = None
     on_before_action: Callable[[Player], None] | None = None
@@ -54,8 +176,8 @@ class Table:
     def play_hand(self) -> HandResult:
         """Play a complete hand. Returns the result."""
         # Setup
-        deck = Deck()
-        deck.shuffle()
+        deck = self.deck if self.deck is not None else Deck()
+        deck.reset_and_shuffle(self.rng)
         pot = PotManager()
         community: list[Card] = []
 
@@ -63,21 +185,22 @@ class Table:
         for p in alive:
             p.reset_for_new_hand()
 
+        # Seat order, blinds and positions for this hand
+        layout = self._compute_hand_layout(alive)
+
         # Post blinds
-        sb_player, bb_player = self._post_blinds(alive, pot)
+        self._post_blinds(layout.sb_player, layout.bb_player, pot)
 
         # Deal hole cards
         for p in alive:
-            p.hole_cards = deck.deal(2)
+            p.hole_cards = tuple(deck.deal(2))
         if self.on_deal:
             self.on_deal("hole_cards", [])
 
-        # Assign positions for this hand
-        positions = self._assign_positions(alive)
-
         went_to_showdown = False
+        hand = _HandContext(self, pot, layout, in_hand_count=len(alive))
 
-        for street_idx, street in enumerate(STREETS):
+        for street in STREETS:
             # Deal community cards
             if street == "flop":
                 deck.deal(1)  # burn
@@ -95,76 +218,47 @@ class Table:
                 if self.on_deal:
                     self.on_deal("river", list(community))
 
+            # One snapshot of the board shared by every decision this street
+            hand.street = street
+            hand.board = tuple(community)
+
             # Reset per-round bets
             for p in alive:
                 p.reset_for_new_round()
 
             # Determine action order
             if street == "preflop":
-                action_order = self._preflop_order(alive, sb_player, bb_player)
+                action_order = layout.preflop_order
                 initial_bet = self.big_blind
             else:
-                action_order = self._postflop_order(alive)
+                # Postflop: first player after the dealer acts first
+                action_order = [p for p in layout.rotated if p.is_in_hand]
                 initial_bet = 0
 
             # Run betting round
-            betting = BettingRound(
+            hand.betting = BettingRound(
                 players=action_order,
                 pot=pot,
                 big_blind=self.big_blind,
                 current_bet=initial_bet,
                 min_raise=self.big_blind,
             )
-
-            def make_context(
-                player: Player,
-                _community: list[Card] = community,
-                _pot: PotManager = pot,
-                _betting: BettingRound = betting,
-                _positions: dict[int, str] = positions,
-                _alive: list[Player] = alive,
-            ) -> PlayerActionContext:
-                to_call = max(0, _betting.current_bet - player.current_bet)
-                min_raise_to = _betting.current_bet + _betting.min_raise
-                max_raise_to = player.current_bet + player.chips
-                return PlayerActionContext(
-                    hole_cards=list(player.hole_cards),
-                    community=list(_community),
-                    pot_total=_pot.total,
-                    to_call=to_call,
-                    min_raise=min_raise_to,
-                    max_raise=max_raise_to,
-                    current_bet=player.current_bet,
-                    street=street,
-                    num_active_players=sum(1 for p in _alive if p.is_in_hand),
-                    position_label=_positions.get(player.seat, "?"),
-                )
-
-            def get_action(
-                player: Player,
-                ctx: PlayerActionContext,
-                _street: str = street,
-                _community: list[Card] = community,
-                _positions: dict[int, str] = positions,
-            ) -> Action:
-                if self.on_before_action:
-                    self.on_before_action(player)
-                if player.is_human and self.get_human_action:
-                    return self.get_human_action(player, ctx)
-                return self._get_bot_action(
-                    player, ctx, _street, _community, _positions
-                )
-
-            betting.run(get_action, make_context, self.on_action)
+            hand.betting.run(hand.get_action, hand.make_context, hand.on_action)
 
             # Check if hand is over (only one player left)
-            in_hand = [p for p in alive if p.is_in_hand]
-            if len(in_hand) <= 1:
+            if hand.in_hand_count <= 1:
                 break
 
         # Showdown / resolve
         in_hand = [p for p in alive if p.is_in_hand]
-        side_pots = PotManager.calculate_side_pots(alive)
+        if hand.any_all_in or max(
+            p.total_bet_this_hand for p in alive
+        ) != min(p.total_bet_this_hand for p in in_hand):
+            side_pots = PotManager.calculate_side_pots(alive)
+        else:
+            # Nobody is all-in and everyone left put in the same amount, the
+            # most anyone did: they're eligible for every chip, so it's one pot.
+            side_pots = []
 
         # If no side pots (everyone folded to one player), make a single pot
         if not side_pots and pot.total > 0:
@@ -188,29 +282,31 @@ class Table:
                 deck.deal(1)  # burn
                 community.extend(deck.deal(1))
 
+            # Evaluate each remaining hand once; side pots only compare them
+            hand_values: dict[int, HandValue] = {
+                p.seat: Hand(cards=[*p.hole_cards, *community]).evaluate()
+                for p in in_hand
+            }
+
             for sp in side_pots:
-                eligible = [p for p in sp.eligible_players if p.is_in_hand]
+                mask = sp.eligible_mask
+                eligible = [p for p in in_hand if mask >> p.seat & 1]
                 if not eligible:
                     continue
 
-                player_hands = [
-                    PlayerHand(
-                        player_id=p.seat,
-                        hole_cards=list(p.hole_cards),
-                    )
-                    for p in eligible
-                ]
-                result = evaluate_game(player_hands, community)
-
-                winning_seats = {w.player_id for w in result.winners}
-                winners = [p for p in eligible if p.seat in winning_seats]
+                hand_value = max(hand_values[p.seat] for p in eligible)
+                winners = [p for p in eligible if hand_values[p.seat] == hand_value]
 
-                share = sp.amount // len(winners)
-                remainder = sp.amount % len(winners)
-                for i, w in enumerate(winners):
-                    w.chips += share + (1 if i < remainder else 0)
+                if len(winners) == 1:
+                    winners[0].chips += sp.amount
+                else:
+                    # Odd chips go to the first winners listed
+                    share, remainder = divmod(sp.amount, len(winners))
+                    for w in winners:
+                        w.chips += share
+                    for w in winners[:remainder]:
+                        w.chips += 1
 
-                hand_value = result.winners[0].hand_value
                 pot_winners.append((sp, winners, hand_value))
 
         if self.on_showdown:
@@ -223,183 +319,87 @@ class Table:
             went_to_showdown=went_to_showdown,
         )
 
-    def _post_blinds(
-        self, alive: list[Player], pot: PotManager
-    ) -> tuple[Player, Player]:
-        """Post small and big blinds. Returns (sb_player, bb_player)."""
+    def _compute_hand_layout(self, alive: list[Player]) -> _HandLayout:
+        """Work out seat order, blinds and positions for the hand in one pass."""
         seats = [p.seat for p in alive]
         dealer_idx = self._find_seat_index(seats, self.dealer_seat)
+        n = len(alive)
+
+        # Everyone clockwise from the seat after the dealer; dealer last
+        rotated = alive[dealer_idx + 1:] + alive[:dealer_idx + 1]
 
-        if len(alive) == 2:
+        if n == 2:
             # Heads-up: dealer posts SB, other posts BB
-            sb_idx = dealer_idx
-            bb_idx = (dealer_idx + 1) % len(alive)
+            sb_player, bb_player = rotated[1], rotated[0]
+            bb_pos = 0
         else:
-            sb_idx = (dealer_idx + 1) % len(alive)
-            bb_idx = (dealer_idx + 2) % len(alive)
-
-        sb_player = alive[sb_idx]
-        bb_player = alive[bb_idx]
-
-        sb_actual = sb_player.bet(self.small_blind)
-        pot.add(sb_actual)
-        bb_actual = bb_player.bet(self.big_blind)
-        pot.add(bb_actual)
-
-        return sb_player, bb_player
+            sb_player, bb_player = rotated[0], rotated[1]
+            bb_pos = 1
 
-    def _preflop_order(
-        self,
-        alive: list[Player],
-        sb_player: Player,
-        bb_player: Player,
-    ) -> list[Player]:
-        """Preflop: UTG acts first (player after BB), BB acts last."""
-        seats = [p.seat for p in alive]
-        bb_idx = seats.index(bb_player.seat)
-        # Start from player after BB
-        order = []
-        for i in range(1, len(alive)):
-            idx = (bb_idx + i) % len(alive)
-            order.append(alive[idx])
-        # BB acts last
-        order.append(bb_player)
-        return order
-
-    def _postflop_order(self, alive: list[Player]) -> list[Player]:
-        """Postflop: SB acts first (first player after dealer)."""
-        seats = [p.seat for p in alive]
-        dealer_idx = self._find_seat_index(seats, self.dealer_seat)
-        order = []
-        for i in range(1, len(alive) + 1):
-            idx = (dealer_idx + i) % len(alive)
-            p = alive[idx]
-            if p.is_in_hand:
-                order.append(p)
-        return order
-
-    def _assign_positions(self, alive: list[Player]) -> dict[int, str]:
-        """Assign position labels to seats."""
-        seats = [p.seat for p in alive]
-        dealer_idx = self._find_seat_index(seats, self.dealer_seat)
-        n = len(alive)
-        positions: dict[int, str] = {}
+        # Preflop: UTG acts first (player after BB), BB acts last
+        preflop_order = rotated[bb_pos + 1:] + rotated[:bb_pos + 1]
 
-        for i in range(n):
-            idx = (dealer_idx + 1 + i) % n
-            player = alive[idx]
+        positions: dict[int, Position] = {}
+        labels: dict[int, str] = {}
+        for i, player in enumerate(rotated):
             try:
                 pos = position_from_utg_distance(i, n)
-                positions[player.seat] = pos.short
+                positions[player.seat] = pos
+                labels[player.seat] = pos.short
             except ValueError:
-                positions[player.seat] = "?"
+                # Unnameable seats play as UTG
+                positions[player.seat] = Position.UTG
+                labels[player.seat] = "?"
+
+        return _HandLayout(
+            rotated=rotated,
+            preflop_order=preflop_order,
+            sb_player=sb_player,
+            bb_player=bb_player,
+            positions=positions,
+            labels=labels,
+        )
 
-        return positions
+    def _post_blinds(
+        self, sb_player: Player, bb_player: Player, pot: PotManager
+    ) -> None:
+        """Post small and big blinds."""
+        sb_actual = sb_player.bet(self.small_blind)
+        pot.add(sb_actual)
+        bb_actual = bb_player.bet(self.big_blind)
+        pot.add(bb_actual)
 
     def _get_bot_action(
         self,
         player: Player,
         ctx: PlayerActionContext,
         street: str,
-        community: list[Card],
-        positions: dict[int, str],
+        community: tuple[Card, ...],
+        positions: dict[int, Position],
     ) -> Action:
         """Adapter: convert bot's BB-based decision to chip-based action."""
-        bb = self.big_blind
-        pos_label = positions.get(player.seat, "UTG")
-
         # Check if this player uses the AI bot
         if player.name in self.ai_bot_configs:
             return self._get_ai_bot_action(
                 player, ctx, street, community, positions
             )
 
-        if player.name not in self._bot_cache:
+        decide = self._bot_fns.get(player.name)
+        if decide is None:
             config = self.bot_configs.get(player.name, BotConfig())
-            self._bot_cache[player.name] = Bot(config)
-        bot = self._bot_cache[player.name]
-
-        # Map position label to Position enum
-        label_to_pos = {
-            "UTG": Position.UTG,
-            "UTG+1": Position.UTG_1,
-            "MP": Position.MP,
-            "HJ": Position.HJ,
-            "CO": Position.CO,
-            "BTN": Position.BTN,
-            "SB": Position.SB,
-            "BB": Position.BB,
-        }
-        position = label_to_pos.get(pos_label, Position.UTG)
-
-        num_opponents = ctx.num_active_players - 1
-        if num_opponents < 1:
-            num_opponents = 1
-
-        game_state = GameState(
-            hole_cards=list(player.hole_cards),
-            community=list(community),
-            position=position,
-            num_opponents=num_opponents,
-            pot_bb=ctx.pot_total / bb if bb > 0 else 0,
-            to_call_bb=ctx.to_call / bb if bb > 0 else 0,
-            street=street,
-            stack_bb=player.chips / bb if bb > 0 else 0,
-            invested_bb=player.total_bet_this_hand / bb if bb > 0 else 0,
-        )
-
-        decision = bot.decide(game_state)
-        action = decision.action
-
-        # Convert BB-based action to chip-based
-        if action.type == ActionType.FOLD:
-            if ctx.to_call == 0:
-                return Action(ActionType.CHECK)
-            return Action(ActionType.FOLD)
-
-        if action.type == ActionType.CHECK:
-            if ctx.to_call > 0:
-                return Action(ActionType.CALL)
-            return Action(ActionType.CHECK)
-
-        if action.type == ActionType.CALL:
-            return Action(ActionType.CALL)
+            decide = self._bot_fns[player.name] = config.compile()
 
-        if action.type in (ActionType.RAISE, ActionType.ALL_IN):
-            raise_bb = action.amount
-            raise_chips = int(raise_bb * bb)
-
-            # The bot's preflop sizing is a raise-to amount (e.g., 2.5 BB).
-            # Postflop sizing is a bet/raise amount relative to the pot.
-            # Convert postflop bets to raise-to by adding the current bet level.
-            current_total = player.current_bet + ctx.to_call
-            if street == "preflop":
-                raise_to = raise_chips
-            else:
-                raise_to = current_total + raise_chips
-
-            # If raise-to is at or below what we'd need to just call,
-            # the bot didn't really intend to raise — just call/check.
-            if raise_to <= current_total:
-                if ctx.to_call > 0:
-                    return Action(ActionType.CALL)
-                return Action(ActionType.CHECK)
-            # Clamp to legal range
-            if raise_to >= player.current_bet + player.chips:
-                return Action(ActionType.ALL_IN, player.current_bet + player.chips)
-            if raise_to < ctx.min_raise:
-                raise_to = ctx.min_raise
-            return Action(ActionType.RAISE, raise_to)
-
-        return Action(ActionType.CHECK)
+        game_state = self._build_game_state(player, ctx, street, community, positions)
+        decision = decide(game_state)
+        return self._convert_bb_action_to_chips(decision.action, player, ctx, street)
 
     def _get_ai_bot_action(
         self,
         player: Player,
         ctx: PlayerActionContext,
         street: str,
-        community: list[Card],
-        positions: dict[int, str],
+        community: tuple[Card, ...],
+        positions: dict[int, Position],
     ) -> Action:
         """Get action from AI-powered bot (Claude Code CLI)."""
         if player.name not in self._ai_bot_cache:
@@ -407,83 +407,104 @@ class Table:
             self._ai_bot_cache[player.name] = AiBot(config)
         ai_bot = self._ai_bot_cache[player.name]
 
-        bb = self.big_blind
-        pos_label = positions.get(player.seat, "UTG")
-
-        label_to_pos = {
-            "UTG": Position.UTG, "UTG+1": Position.UTG_1,
-            "MP": Position.MP, "HJ": Position.HJ,
-            "CO": Position.CO, "BTN": Position.BTN,
-            "SB": Position.SB, "BB": Position.BB,
-        }
-        position = label_to_pos.get(pos_label, Position.UTG)
-
-        num_opponents = ctx.num_active_players - 1
-        if num_opponents < 1:
-            num_opponents = 1
-
-        game_state = GameState(
-            hole_cards=list(player.hole_cards),
-            community=list(community),
-            position=position,
-            num_opponents=num_opponents,
-            pot_bb=ctx.pot_total / bb if bb > 0 else 0,
-            to_call_bb=ctx.to_call / bb if bb > 0 else 0,
-            street=street,
-            stack_bb=player.chips / bb if bb > 0 else 0,
-            invested_bb=player.total_bet_this_hand / bb if bb > 0 else 0,
-        )
-
+        game_state = self._build_game_state(player, ctx, street, community, positions)
         decision = ai_bot.decide(game_state)
-        action = decision.action
 
         # Fire debug callback
         if self.on_ai_debug and ai_bot.last_debug:
             self.on_ai_debug(player, ai_bot.last_debug, decision.reasoning)
 
-        # Convert BB-based action to chip-based (same logic as rule-based bot)
+        return self._convert_bb_action_to_chips(decision.action, player, ctx, street)
+
+    def _build_game_state(
+        self,
+        player: Player,
+        ctx: PlayerActionContext,
+        street: str,
+        community: tuple[Card, ...],
+        positions: dict[int, Position],
+    ) -> GameState:
+        """Describe the spot to a bot, with money in big blinds."""
+        bb = self.big_blind
+        per_bb = 1.0 / bb if bb > 0 else 0.0
+        return GameState(
+            hole_cards=player.hole_cards,
+            community=community,
+            position=positions[player.seat],
+            num_opponents=max(1, ctx.num_active_players - 1),
+            pot_bb=ctx.pot_total * per_bb,
+            to_call_bb=ctx.to_call * per_bb,
+            street=street,
+            stack_bb=player.chips * per_bb,
+            invested_bb=player.total_bet_this_hand * per_bb,
+        )
+
+    def _convert_bb_action_to_chips(
+        self,
+        action: Action,
+        player: Player,
+        ctx: PlayerActionContext,
+        street: str,
+    ) -> Action:
+        """Turn a bot's BB-sized action into a legal chip-sized one."""
         if action.type == ActionType.FOLD:
             if ctx.to_call == 0:
-                return Action(ActionType.CHECK)
-            return Action(ActionType.FOLD)
+                return Action.get(ActionType.CHECK)
+            return Action.get(ActionType.FOLD)
 
         if action.type == ActionType.CHECK:
             if ctx.to_call > 0:
-                return Action(ActionType.CALL)
-            return Action(ActionType.CHECK)
+                return Action.get(ActionType.CALL)
+            return Action.get(ActionType.CHECK)
 
         if action.type == ActionType.CALL:
-            return Action(ActionType.CALL)
+            return Action.get(ActionType.CALL)
 
         if action.type in (ActionType.RAISE, ActionType.ALL_IN):
-            raise_bb = action.amount
-            raise_chips = int(raise_bb * bb)
-            current_total = player.current_bet + ctx.to_call
+            raise_chips = int(action.amount * self.big_blind)
 
+            # The bot's preflop sizing is a raise-to amount (e.g., 2.5 BB).
+            # Postflop sizing is a bet/raise amount relative to the pot.
+            # Convert postflop bets to raise-to by adding the current bet level.
+            current_total = player.current_bet + ctx.to_call
             if street == "preflop":
                 raise_to = raise_chips
             else:
                 raise_to = current_total + raise_chips
 
+            # If raise-to is at or below what we'd need to just call,
+            # the bot didn't really intend to raise — just call/check.
             if raise_to <= current_total:
                 if ctx.to_call > 0:
-                    return Action(ActionType.CALL)
-                return Action(ActionType.CHECK)
+                    return Action.get(ActionType.CALL)
+                return Action.get(ActionType.CHECK)
+            # Clamp to legal range
             if raise_to >= player.current_bet + player.chips:
                 return Action(ActionType.ALL_IN, player.current_bet + player.chips)
             if raise_to < ctx.min_raise:
                 raise_to = ctx.min_raise
             return Action(ActionType.RAISE, raise_to)
 
-        return Action(ActionType.CHECK)
-
-    @staticmethod
-    def _find_seat_index(seats: list[int], target: int) -> int:
-        """Find the index of `target` in seats, or closest seat after it."""
-        if target in seats:
-            return seats.index(target)
-        # Find next seat clockwise
-        for i, s in enumerate(seats):
-            if s > target:
-                return i
-        return 0
+        return Action.get(ActionType.CHECK)
+
+    def _find_seat_index(self, seats: list[int], target: int) -> int:
+        """Find the index of `target` in seats, or closest seat after it.
+
+        The lookup is rebuilt only when the alive seats change.
+        """
+        key = tuple(seats)
+        if key != self._indexed_seats:
+            self._index_seats(key)
+        lookup = self._seat_to_idx
+        return lookup[target] if 0 <= target < len(lookup) else 0
+
+    def _index_seats(self, seats: tuple[int, ...]) -> None:
+        """Rebuild the seat -> index lookup for a new set of alive seats."""
+        lookup = [0] * (max(seats) + 1)
+        at = dict(zip(seats, range(len(seats))))
+        nxt = 0  # past the last seat wraps to the first
+        for seat in range(len(lookup) - 1, -1, -1):
+            nxt = at.get(seat, nxt)
+            lookup[seat] = nxt
+        self._seat_to_idx = lookup
+        self._indexed_seats = seats
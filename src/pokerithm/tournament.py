@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Callable
+import os
+import random
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
 
 from .action import Action
 from .ai_bot import AiBotConfig, AiDebugInfo
 from .bot import BotConfig
 from .card import Card
+from .deck import Deck
 from .player import Player, PlayerActionContext
 from .table import HandResult, Table
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlindLevel:
     """A blind level in the tournament schedule."""
 
@@ -21,24 +28,32 @@ class BlindLevel:
     big_blind: int
 
 
-DEFAULT_BLIND_SCHEDULE: list[BlindLevel] = [
-    BlindLevel(10, 20),
-    BlindLevel(15, 30),
-    BlindLevel(25, 50),
-    BlindLevel(50, 100),
-    BlindLevel(75, 150),
-    BlindLevel(100, 200),
-    BlindLevel(150, 300),
-    BlindLevel(200, 400),
-    BlindLevel(300, 600),
-    BlindLevel(500, 1000),
-]
+def blind_schedule_from(levels: Iterable[tuple[int, int]]) -> list[BlindLevel]:
+    """Build a blind schedule from ``(small_blind, big_blind)`` pairs."""
+    return [BlindLevel(sb, bb) for sb, bb in levels]
+
+
+DEFAULT_BLIND_SCHEDULE: list[BlindLevel] = blind_schedule_from([
+    (10, 20),
+    (15, 30),
+    (25, 50),
+    (50, 100),
+    (75, 150),
+    (100, 200),
+    (150, 300),
+    (200, 400),
+    (300, 600),
+    (500, 1000),
+])
 
 STARTING_STACK = 1500
 HANDS_PER_LEVEL = 10
 
+# Column order of the records in `Tournament.result_buffer`
+RESULT_FIELDS = ("hand_number", "dealer_seat", "winner_seat", "pot")
+
 
-@dataclass
+@dataclass(slots=True)
 class TournamentConfig:
     """Configuration for a tournament."""
 
@@ -50,7 +65,7 @@ class TournamentConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Tournament:
     """Tournament loop — plays hands until one player remains."""
 
@@ -63,7 +78,8 @@ class Tournament:
 
     # Callbacks
     on_hand_start: Callable[[int, BlindLevel, int], None] | None = None
-    on_hand_end: Callable[[HandResult], None] | None = None
+    # Returning False stops the tournament once the hand is settled
+    on_hand_end: Callable[[HandResult], bool | None] | None = None
     on_elimination: Callable[[Player, int], None] | None = None
     on_blind_increase: Callable[[BlindLevel, int], None] | None = None
     on_tournament_end: Callable[[Player], None] | None = None
@@ -76,11 +92,49 @@ class Tournament:
     dealer_seat: int = 0
     hand_number: int = 0
     blind_level_idx: int = 0
+    seed: int | None = None  # seeds the deck shuffles for reproducible runs
+
+    # Flat per-hand records for bulk analysis: four ints per hand
+    # (hand_number, dealer_seat, winner_seat, pot).  See `RESULT_FIELDS`.
+    result_buffer: array | None = None
 
     def run(self) -> Player:
-        """Run the tournament to completion. Returns the winner."""
+        """Run the tournament to completion. Returns the winner.
+
+        If ``on_hand_end`` returns False the run stops after that hand and
+        returns the chip leader; ``on_tournament_end`` only fires when a
+        single player is left.
+        """
         alive = [p for p in self.players if not p.is_eliminated]
         self.dealer_seat = alive[0].seat
+        # Sorted alive seats and the dealer's index into them; rebuilt
+        # only when someone busts, otherwise the button just steps on
+        alive_seats = sorted(p.seat for p in alive)
+        dealer_idx = bisect_left(alive_seats, self.dealer_seat)
+
+        schedule = self.config.blind_schedule
+        hands_per_level = self.config.hands_per_level
+        last_level_idx = len(schedule) - 1
+        level = schedule[self.blind_level_idx]
+
+        # One table for the whole tournament so the deck and the bots
+        # (and their caches) carry over; only the button and blinds move
+        table = Table(
+            players=self.players,
+            dealer_seat=self.dealer_seat,
+            small_blind=level.small_blind,
+            big_blind=level.big_blind,
+            get_human_action=self.get_human_action,
+            bot_configs=self.bot_configs,
+            ai_bot_configs=self.ai_bot_configs,
+            on_action=self.on_action,
+            on_before_action=self.on_before_action,
+            on_ai_debug=self.on_ai_debug,
+            on_deal=self.on_deal,
+            on_showdown=self.on_showdown,
+            rng=random.Random(self.seed) if self.seed is not None else None,
+            deck=Deck(),
+        )
 
         while len(alive) > 1:
             self.hand_number += 1
@@ -88,73 +142,125 @@ class Tournament:
             # Check for blind increase
             if (
                 self.hand_number > 1
-                and (self.hand_number - 1) % self.config.hands_per_level == 0
+                and (self.hand_number - 1) % hands_per_level == 0
+                and self.blind_level_idx < last_level_idx
             ):
-                if self.blind_level_idx < len(self.config.blind_schedule) - 1:
-                    self.blind_level_idx += 1
-                    level = self.config.blind_schedule[self.blind_level_idx]
-                    if self.on_blind_increase:
-                        self.on_blind_increase(level, self.blind_level_idx)
-
-            level = self.config.blind_schedule[self.blind_level_idx]
+                self.blind_level_idx += 1
+                level = schedule[self.blind_level_idx]
+                table.small_blind = level.small_blind
+                table.big_blind = level.big_blind
+                if self.on_blind_increase:
+                    self.on_blind_increase(level, self.blind_level_idx)
 
             if self.on_hand_start:
                 self.on_hand_start(self.hand_number, level, self.dealer_seat)
 
             # Play the hand
-            table = Table(
-                players=self.players,
-                dealer_seat=self.dealer_seat,
-                small_blind=level.small_blind,
-                big_blind=level.big_blind,
-                get_human_action=self.get_human_action,
-                bot_configs=self.bot_configs,
-                ai_bot_configs=self.ai_bot_configs,
-                on_action=self.on_action,
-                on_before_action=self.on_before_action,
-                on_ai_debug=self.on_ai_debug,
-                on_deal=self.on_deal,
-                on_showdown=self.on_showdown,
-            )
+            table.dealer_seat = self.dealer_seat
 
             result = table.play_hand()
 
+            if self.result_buffer is not None:
+                self._record(self.result_buffer, result)
+            stop = False
             if self.on_hand_end:
-                self.on_hand_end(result)
+                stop = self.on_hand_end(result) is False
 
-            # Clear hand state so is_eliminated works correctly
-            for p in self.players:
+            # Clear hand state so is_eliminated works correctly; busted
+            # players were cleared on the hand they busted and sit out since
+            for p in alive:
                 p.is_all_in = False
                 p.is_folded = False
 
             # Check for eliminations
-            for p in alive:
-                if p.is_eliminated:
-                    place = len([x for x in self.players if x.is_eliminated])
-                    finish_position = len(self.players) - place + 1
-                    if self.on_elimination:
-                        self.on_elimination(p, finish_position)
+            busted = [p for p in alive if p.is_eliminated]
+            if busted and self.on_elimination:
+                # Everyone busting on the same hand shares the place just
+                # below the survivors
+                finish_position = len(alive) - len(busted) + 1
+                for p in busted:
+                    self.on_elimination(p, finish_position)
 
             # Advance dealer
-            alive = [p for p in self.players if not p.is_eliminated]
-            if alive:
-                self.dealer_seat = self._next_dealer(alive)
+            if busted:
+                alive = [p for p in alive if not p.is_eliminated]
+                if not alive:
+                    break
+                alive_seats = sorted(p.seat for p in alive)
+                dealer_idx = self._next_dealer_idx(alive_seats)
+            else:
+                dealer_idx = (dealer_idx + 1) % len(alive_seats)
+            self.dealer_seat = alive_seats[dealer_idx]
+
+            if stop:
+                return max(alive, key=lambda p: p.chips)
 
         winner = alive[0]
         if self.on_tournament_end:
             self.on_tournament_end(winner)
         return winner
 
-    def _next_dealer(self, alive: list[Player]) -> int:
-        """Advance dealer to the next alive player."""
-        seats = sorted(p.seat for p in alive)
-        current_idx = None
-        for i, s in enumerate(seats):
-            if s >= self.dealer_seat:
-                current_idx = i
-                break
-        if current_idx is None:
+    def run_batch(
+        self, seeds: list[int], max_workers: int | None = None
+    ) -> list[Player]:
+        """Play one independent tournament per seed across worker processes.
+
+        Each worker starts a fresh copy of this tournament's config, players
+        and bot configs.  Callbacks and ``get_human_action`` aren't picklable,
+        so they are dropped and every seat is played by a bot.  This
+        tournament's own players are not touched.
+
+        Returns the winners (copies from the workers) in ``seeds`` order.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        play = partial(
+            _play_one,
+            self.config,
+            [replace(p) for p in self.players],
+            self.bot_configs,
+            self.ai_bot_configs,
+        )
+        chunksize = max(1, len(seeds) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(play, seeds, chunksize=chunksize))
+
+    def _record(self, buf: array, result: HandResult) -> None:
+        """Append one hand to ``buf`` (the `result_buffer`).
+
+        The winner is the first winner of the main pot, or -1 if the
+        hand had no pot.
+        """
+        winner_seat = -1
+        if result.pot_winners and result.pot_winners[0][1]:
+            winner_seat = result.pot_winners[0][1][0].seat
+        total_pot = sum(pot.amount for pot in result.pots)
+        buf.extend(
+            (self.hand_number, self.dealer_seat, winner_seat, total_pot)
+        )
+
+    def _next_dealer_idx(self, seats: list[int]) -> int:
+        """Index in sorted `seats` of the seat after the current dealer."""
+        current_idx = bisect_left(seats, self.dealer_seat)
+        if current_idx == len(seats):
             current_idx = 0
-
-        next_idx = (current_idx + 1) % len(seats)
-        return seats[next_idx]
+        return (current_idx + 1) % len(seats)
+
+
+def _play_one(
+    config: TournamentConfig,
+    players: list[Player],
+    bot_configs: dict[str, BotConfig],
+    ai_bot_configs: dict[str, AiBotConfig],
+    seed: int,
+) -> Player:
+    """Worker for `Tournament.run_batch`: play one seeded tournament."""
+    # Bot equity estimates sample from the module-level generator
+    random.seed(seed)
+    tournament = Tournament(
+        config=config,
+        players=[replace(p, is_human=False) for p in players],
+        bot_configs=bot_configs,
+        ai_bot_configs=ai_bot_configs,
+        seed=seed,
+    )
+    return tournament.run()
@@ -0,0 +1,8 @@
+"""Shared card constants for the tests."""
+
+from pokerithm.card import Card
+
+# Every card by its short name ("As", "Td", ...), parsed once for all tests
+CARDS: dict[str, Card] = {
+    r + s: Card.from_str(r + s) for r in "23456789TJQKA" for s in "cdhs"
+}
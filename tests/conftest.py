@@ -0,0 +1,57 @@
+"""Shared fixtures."""
+
+import pytest
+
+from pokerithm.bot import Bot, BotConfig
+
+# The bot play-styles the decision tests use, all seeded
+BOT_CONFIGS: dict[str, BotConfig] = {
+    "no_bluff": BotConfig(seed=42, bluff_frequency=0.0),
+    "max_bluff": BotConfig(seed=42, bluff_frequency=1.0, aggression=1.0),
+    "loose": BotConfig(seed=42, bluff_frequency=0.0, tightness=0.3),
+    "aggro": BotConfig(seed=42, bluff_frequency=0.0, aggression=0.8),
+    "passive": BotConfig(seed=42, bluff_frequency=0.0, aggression=0.0),
+    "balanced": BotConfig(seed=42, bluff_frequency=0.0, aggression=0.5),
+}
+
+
+@pytest.fixture(scope="module")
+def _bots() -> dict[str, Bot]:
+    """One bot per play-style, built once per test module."""
+    return {name: Bot(cfg) for name, cfg in BOT_CONFIGS.items()}
+
+
+def _fresh(bots: dict[str, Bot], name: str) -> Bot:
+    bot = bots[name]
+    bot.reset()
+    return bot
+
+
+@pytest.fixture
+def bot_no_bluff(_bots: dict[str, Bot]) -> Bot:
+    return _fresh(_bots, "no_bluff")
+
+
+@pytest.fixture
+def bot_max_bluff(_bots: dict[str, Bot]) -> Bot:
+    return _fresh(_bots, "max_bluff")
+
+
+@pytest.fixture
+def bot_loose(_bots: dict[str, Bot]) -> Bot:
+    return _fresh(_bots, "loose")
+
+
+@pytest.fixture
+def bot_aggro(_bots: dict[str, Bot]) -> Bot:
+    return _fresh(_bots, "aggro")
+
+
+@pytest.fixture
+def bot_passive(_bots: dict[str, Bot]) -> Bot:
+    return _fresh(_bots, "passive")
+
+
+@pytest.fixture
+def bot_balanced(_bots: dict[str, Bot]) -> Bot:
+    return _fresh(_bots, "balanced")
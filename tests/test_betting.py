@@ -1,5 +1,7 @@
 """Tests for betting round state machine."""
 
+from collections.abc import Callable
+
 from pokerithm.action import Action, ActionType
 from pokerithm.betting import BettingRound
 from pokerithm.player import Player, PlayerActionContext
@@ -13,8 +15,8 @@ def _make_players(n: int, chips: int = 1000) -> list[Player]:
 def _make_context(player: Player, betting: BettingRound, pot: PotManager) -> PlayerActionContext:
     to_call = max(0, betting.current_bet - player.current_bet)
     return PlayerActionContext(
-        hole_cards=[],
-        community=[],
+        hole_cards=(),
+        community=(),
         pot_total=pot.total,
         to_call=to_call,
         min_raise=betting.current_bet + betting.min_raise,
@@ -26,6 +28,18 @@ def _make_context(player: Player, betting: BettingRound, pot: PotManager) -> Pla
     )
 
 
+def _scripted(
+    action_map: dict[int, list[Action]],
+) -> Callable[[Player, PlayerActionContext], Action]:
+    """Get-action callback that replays each seat's actions in order."""
+    queues = {seat: iter(actions) for seat, actions in action_map.items()}
+
+    def get_action(p: Player, ctx: PlayerActionContext) -> Action:
+        return next(queues[p.seat])
+
+    return get_action
+
+
 class TestBettingRound:
     def test_check_around(self):
         """All players check — round completes."""
@@ -59,14 +73,8 @@ class TestBettingRound:
             1: [Action(ActionType.CALL)],          # P1 calls
             2: [Action(ActionType.CALL)],          # P2 calls
         }
-        indices = {0: 0, 1: 0, 2: 0}
 
-        def get_action(p: Player, ctx: PlayerActionContext) -> Action:
-            idx = indices[p.seat]
-            indices[p.seat] += 1
-            return action_map[p.seat][idx]
-
-        betting.run(get_action, lambda p: _make_context(p, betting, pot))
+        betting.run(_scripted(action_map), lambda p: _make_context(p, betting, pot))
 
         assert pot.total == 300
         assert all(p.current_bet == 100 for p in players)
@@ -82,14 +90,8 @@ class TestBettingRound:
             1: [Action(ActionType.RAISE, 200)],
             2: [Action(ActionType.FOLD)],
         }
-        indices = {0: 0, 1: 0, 2: 0}
-
-        def get_action(p: Player, ctx: PlayerActionContext) -> Action:
-            idx = indices[p.seat]
-            indices[p.seat] += 1
-            return action_map[p.seat][idx]
 
-        betting.run(get_action, lambda p: _make_context(p, betting, pot))
+        betting.run(_scripted(action_map), lambda p: _make_context(p, betting, pot))
 
         assert players[0].current_bet == 200
         assert players[1].current_bet == 200
@@ -107,14 +109,8 @@ class TestBettingRound:
             1: [Action(ActionType.FOLD)],
             2: [Action(ActionType.FOLD)],
         }
-        indices = {0: 0, 1: 0, 2: 0}
 
-        def get_action(p: Player, ctx: PlayerActionContext) -> Action:
-            idx = indices[p.seat]
-            indices[p.seat] += 1
-            return action_map[p.seat][idx]
-
-        betting.run(get_action, lambda p: _make_context(p, betting, pot))
+        betting.run(_scripted(action_map), lambda p: _make_context(p, betting, pot))
 
         assert players[0].is_active
         assert players[1].is_folded
@@ -130,14 +126,14 @@ class TestBettingRound:
             0: [Action(ActionType.ALL_IN, 500)],
             1: [Action(ActionType.CALL)],
         }
-        indices = {0: 0, 1: 0}
 
-        def get_action(p: Player, ctx: PlayerActionContext) -> Action:
-            idx = indices[p.seat]
-            indices[p.seat] += 1
-            return action_map[p.seat][idx]
-
-        betting.run(get_action, lambda p: _make_context(p, betting, pot))
+        betting.run(_scripted(action_map), lambda p: _make_context(p, betting, pot))
 
         assert players[0].is_all_in
         assert pot.total == 1000
+
+    def test_sizeless_actions_are_shared(self):
+        """Action.get reuses one instance per fold/check/call, not for raises."""
+        assert Action.get(ActionType.FOLD) is Action.get(ActionType.FOLD)
+        assert Action.get(ActionType.CALL) == Action(ActionType.CALL)
+        assert Action.get(ActionType.RAISE, 60) == Action(ActionType.RAISE, 60)
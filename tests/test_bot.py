@@ -1,111 +1,91 @@
 """Tests for bot decision engine."""
 
-from pokerithm.card import card
+import pytest
+
 from pokerithm.action import ActionType
 from pokerithm.bot import Bot, BotConfig, GameState
 from pokerithm.position import Position
 from pokerithm.ranges import hole_cards_to_key
+from tests.cards import CARDS
+
+
+def _preflop_state(
+    hole: str,
+    position: Position,
+    opponents: int,
+    pot: float,
+    to_call: float,
+    stack: float,
+    invested: float = 0.0,
+) -> GameState:
+    """Preflop spot with ``hole`` given as e.g. ``"As Ah"``."""
+    return GameState(
+        hole_cards=tuple(CARDS[c] for c in hole.split()),
+        community=(),
+        position=position,
+        num_opponents=opponents,
+        pot_bb=pot,
+        to_call_bb=to_call,
+        street="preflop",
+        stack_bb=stack,
+        invested_bb=invested,
+    )
 
 
 class TestRangeKeys:
     def test_suited_hand(self):
-        assert hole_cards_to_key(card("As"), card("Ks")) == "AKs"
+        assert hole_cards_to_key(CARDS["As"], CARDS["Ks"]) == "AKs"
 
     def test_offsuit_hand(self):
-        assert hole_cards_to_key(card("As"), card("Kh")) == "AKo"
+        assert hole_cards_to_key(CARDS["As"], CARDS["Kh"]) == "AKo"
 
     def test_pair(self):
-        assert hole_cards_to_key(card("7s"), card("7h")) == "77"
+        assert hole_cards_to_key(CARDS["7s"], CARDS["7h"]) == "77"
 
     def test_order_independence(self):
-        assert hole_cards_to_key(card("9d"), card("Ts")) == "T9o"
-        assert hole_cards_to_key(card("Ts"), card("9s")) == "T9s"
+        assert hole_cards_to_key(CARDS["9d"], CARDS["Ts"]) == "T9o"
+        assert hole_cards_to_key(CARDS["Ts"], CARDS["9s"]) == "T9s"
 
 
 class TestPreflopDecisions:
-    def test_premium_raises_from_utg(self):
-        """AA should always raise, even from the tightest position."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("As"), card("Ah")],
-            community=[],
-            position=Position.UTG,
-            num_opponents=5,
-            pot_bb=1.5,
-            to_call_bb=0.0,
-            street="preflop",
-            stack_bb=100.0,
+    @pytest.mark.parametrize(
+        "hole,position,opponents,pot,to_call,stack,invested,expected",
+        [
+            # AA should always raise, even from the tightest position
+            pytest.param("As Ah", Position.UTG, 5, 1.5, 0.0, 100.0, 0.0,
+                         ActionType.RAISE, id="premium_raises_from_utg"),
+            # 72o should fold from UTG (no bluffs)
+            pytest.param("7d 2c", Position.UTG, 5, 1.5, 1.0, 100.0, 0.0,
+                         ActionType.FOLD, id="trash_folds_from_utg"),
+            # With trash in the BB and no raise to face, should check
+            pytest.param("7d 2c", Position.BB, 2, 2.0, 0.0, 100.0, 0.0,
+                         ActionType.CHECK, id="free_check_bb"),
+        ],
+    )
+    def test_preflop_decision(
+        self, bot_no_bluff, hole, position, opponents, pot, to_call, stack,
+        invested, expected,
+    ):
+        state = _preflop_state(
+            hole, position, opponents, pot, to_call, stack, invested
         )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.RAISE
+        assert bot_no_bluff.decide(state).action.type == expected
 
-    def test_trash_folds_from_utg(self):
-        """72o should fold from UTG (no bluffs)."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[],
-            position=Position.UTG,
-            num_opponents=5,
-            pot_bb=1.5,
-            to_call_bb=1.0,
-            street="preflop",
-            stack_bb=100.0,
-        )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.FOLD
-
-    def test_wider_from_button(self):
+    def test_wider_from_button(self, bot_loose):
         """A marginal hand like K9s should open from BTN but not UTG."""
-        cfg = BotConfig(seed=42, bluff_frequency=0.0, tightness=0.3)
-
-        state_btn = GameState(
-            hole_cards=[card("Ks"), card("9s")],
-            community=[],
-            position=Position.BTN,
-            num_opponents=2,
-            pot_bb=1.5,
-            to_call_bb=0.0,
-            street="preflop",
-            stack_bb=100.0,
-        )
-        state_utg = GameState(
-            hole_cards=[card("Ks"), card("9s")],
-            community=[],
-            position=Position.UTG,
-            num_opponents=5,
-            pot_bb=1.5,
-            to_call_bb=1.0,
-            street="preflop",
-            stack_bb=100.0,
-        )
-        assert Bot(cfg).decide(state_btn).action.type == ActionType.RAISE
-        assert Bot(cfg).decide(state_utg).action.type == ActionType.FOLD
-
-    def test_free_check_bb(self):
-        """With trash in the BB and no raise to face, should check."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[],
-            position=Position.BB,
-            num_opponents=2,
-            pot_bb=2.0,
-            to_call_bb=0.0,
-            street="preflop",
-            stack_bb=100.0,
-        )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.CHECK
+        state_btn = _preflop_state("Ks 9s", Position.BTN, 2, 1.5, 0.0, 100.0)
+        state_utg = _preflop_state("Ks 9s", Position.UTG, 5, 1.5, 1.0, 100.0)
+        assert bot_loose.decide(state_btn).action.type == ActionType.RAISE
+        bot_loose.reset()
+        assert bot_loose.decide(state_utg).action.type == ActionType.FOLD
 
 
 class TestBluffing:
-    def test_always_bluff_limped_pot(self):
+    def test_always_bluff_limped_pot(self, bot_max_bluff):
         """With bluff_frequency=1.0, trash bluff-raises in a limped pot (1 BB to call)."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=1.0, aggression=1.0))
         state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[],
+            hole_cards=(CARDS["7d"], CARDS["2c"]),
+            community=(),
             position=Position.UTG,
             num_opponents=5,
             pot_bb=1.5,
@@ -113,16 +93,15 @@ class TestBluffing:
             street="preflop",
             stack_bb=100.0,
         )
-        decision = bot.decide(state)
+        decision = bot_max_bluff.decide(state)
         assert decision.action.type == ActionType.RAISE
         assert "Bluff" in decision.reasoning
 
-    def test_always_bluff_unopened(self):
+    def test_always_bluff_unopened(self, bot_max_bluff):
         """With bluff_frequency=1.0 and high aggression, trash should bluff in unopened pot."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=1.0, aggression=1.0))
         state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[],
+            hole_cards=(CARDS["7d"], CARDS["2c"]),
+            community=(),
             position=Position.BTN,
             num_opponents=2,
             pot_bb=1.5,
@@ -130,16 +109,15 @@ class TestBluffing:
             street="preflop",
             stack_bb=100.0,
         )
-        decision = bot.decide(state)
+        decision = bot_max_bluff.decide(state)
         assert decision.action.type == ActionType.RAISE
         assert "Bluff" in decision.reasoning
 
-    def test_never_bluff(self):
+    def test_never_bluff(self, bot_no_bluff):
         """With bluff_frequency=0, trash should never bluff."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
         state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[],
+            hole_cards=(CARDS["7d"], CARDS["2c"]),
+            community=(),
             position=Position.BTN,
             num_opponents=2,
             pot_bb=1.5,
@@ -147,7 +125,7 @@ class TestBluffing:
             street="preflop",
             stack_bb=100.0,
         )
-        decision = bot.decide(state)
+        decision = bot_no_bluff.decide(state)
         assert decision.action.type == ActionType.FOLD
 
 
@@ -156,8 +134,8 @@ class TestSeedDeterminism:
         """Identical seed + state must produce identical output."""
         cfg = BotConfig(seed=123)
         state = GameState(
-            hole_cards=[card("Td"), card("9d")],
-            community=[],
+            hole_cards=(CARDS["Td"], CARDS["9d"]),
+            community=(),
             position=Position.CO,
             num_opponents=3,
             pot_bb=1.5,
@@ -170,14 +148,35 @@ class TestSeedDeterminism:
         assert d1.action == d2.action
         assert d1.reasoning == d2.reasoning
 
+    def test_reset_replays_decisions(self):
+        """After reset() a bot repeats what it decided when newly built."""
+        bot = Bot(BotConfig(seed=123))
+        state = GameState(
+            hole_cards=(CARDS["Td"], CARDS["9d"]),
+            community=(),
+            position=Position.CO,
+            num_opponents=3,
+            pot_bb=1.5,
+            to_call_bb=0.0,
+            street="preflop",
+            stack_bb=100.0,
+        )
+        first = [bot.decide(state).action for _ in range(5)]
+        bot.reset()
+        again = [bot.decide(state).action for _ in range(5)]
+        assert first == again
+
 
 class TestPostflopDecisions:
     def test_high_equity_raises(self):
         """Top set on a dry board should raise."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0, aggression=0.8))
+        bot = Bot(BotConfig(
+            seed=42, bluff_frequency=0.0, aggression=0.8,
+            equity_fn=lambda state: 92.0,
+        ))
         state = GameState(
-            hole_cards=[card("As"), card("Ah")],
-            community=[card("Ad"), card("7c"), card("2h")],
+            hole_cards=(CARDS["As"], CARDS["Ah"]),
+            community=(CARDS["Ad"], CARDS["7c"], CARDS["2h"]),
             position=Position.BTN,
             num_opponents=1,
             pot_bb=6.0,
@@ -192,10 +191,12 @@ class TestPostflopDecisions:
 
     def test_low_equity_folds(self):
         """Complete air on a wet board facing a big bet should fold."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
+        bot = Bot(BotConfig(
+            seed=42, bluff_frequency=0.0, equity_fn=lambda state: 4.0,
+        ))
         state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[card("As"), card("Ks"), card("Qs")],
+            hole_cards=(CARDS["7d"], CARDS["2c"]),
+            community=(CARDS["As"], CARDS["Ks"], CARDS["Qs"]),
             position=Position.UTG,
             num_opponents=3,
             pot_bb=10.0,
@@ -206,12 +207,11 @@ class TestPostflopDecisions:
         decision = bot.decide(state)
         assert decision.action.type == ActionType.FOLD
 
-    def test_free_check_postflop(self):
+    def test_free_check_postflop(self, bot_passive):
         """Should check when there's nothing to call."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0, aggression=0.0))
         state = GameState(
-            hole_cards=[card("9d"), card("8c")],
-            community=[card("2s"), card("3h"), card("Kd")],
+            hole_cards=(CARDS["9d"], CARDS["8c"]),
+            community=(CARDS["2s"], CARDS["3h"], CARDS["Kd"]),
             position=Position.UTG,
             num_opponents=2,
             pot_bb=4.0,
@@ -219,16 +219,15 @@ class TestPostflopDecisions:
             street="flop",
             stack_bb=100.0,
         )
-        decision = bot.decide(state)
+        decision = bot_passive.decide(state)
         assert decision.action.type in (ActionType.CHECK, ActionType.RAISE)
 
-    def test_postflop_bluff_late_position_only(self):
+    def test_postflop_bluff_late_position_only(self, bot_max_bluff):
         """Bluffs should only happen from late position or blinds."""
         # From UTG with max bluff — still shouldn't bluff postflop
-        bot = Bot(BotConfig(seed=42, bluff_frequency=1.0, aggression=1.0))
         state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[card("As"), card("Ks"), card("Qs")],
+            hole_cards=(CARDS["7d"], CARDS["2c"]),
+            community=(CARDS["As"], CARDS["Ks"], CARDS["Qs"]),
             position=Position.UTG,
             num_opponents=3,
             pot_bb=10.0,
@@ -236,139 +235,95 @@ class TestPostflopDecisions:
             street="flop",
             stack_bb=100.0,
         )
-        decision = bot.decide(state)
+        decision = bot_max_bluff.decide(state)
         # From UTG, should fold — no postflop bluffing from early position
         assert decision.action.type == ActionType.FOLD
 
+    def test_equity_reused_for_same_spot(self, monkeypatch):
+        """A repeated postflop spot reuses the equity estimate."""
+        import pokerithm.bot as bot_module
 
-class TestShortStackPushFold:
-    def test_premium_shove_short_stack(self):
-        """AA should shove with a short stack."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("As"), card("Ah")],
-            community=[],
-            position=Position.BTN,
-            num_opponents=2,
-            pot_bb=1.5,
-            to_call_bb=0.0,
-            street="preflop",
-            stack_bb=8.0,
-            invested_bb=0.0,
-        )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.ALL_IN
-
-    def test_trash_folds_short_stack(self):
-        """72o should fold even when short-stacked."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[],
-            position=Position.UTG,
-            num_opponents=5,
-            pot_bb=1.5,
-            to_call_bb=1.0,
-            street="preflop",
-            stack_bb=8.0,
-            invested_bb=0.0,
-        )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.FOLD
+        calls = []
+        real = bot_module.calculate_equity
 
-    def test_wider_push_very_short(self):
-        """With 5 BB, push range should be wider — K7o is a shove."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("Kd"), card("7h")],
-            community=[],
-            position=Position.BTN,
-            num_opponents=2,
-            pot_bb=1.5,
-            to_call_bb=0.0,
-            street="preflop",
-            stack_bb=5.0,
-            invested_bb=1.0,
-        )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.ALL_IN
+        def counting(**kwargs):
+            calls.append(kwargs)
+            return real(**kwargs)
 
-    def test_deep_stack_does_not_push(self):
-        """With 100 BB, should open-raise, not shove."""
+        monkeypatch.setattr(bot_module, "calculate_equity", counting)
         bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
         state = GameState(
-            hole_cards=[card("As"), card("Ah")],
-            community=[],
+            hole_cards=(CARDS["Kd"], CARDS["Qd"]),
+            community=(CARDS["Ks"], CARDS["7c"], CARDS["2h"]),
             position=Position.BTN,
-            num_opponents=2,
-            pot_bb=1.5,
-            to_call_bb=0.0,
-            street="preflop",
+            num_opponents=1,
+            pot_bb=6.0,
+            to_call_bb=3.0,
+            street="flop",
             stack_bb=100.0,
         )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.RAISE
-        assert decision.action.type != ActionType.ALL_IN
+        first = bot.decide(state)
+        second = bot.decide(state)
+        assert len(calls) == 1
+        assert first.equity == second.equity
 
 
-class TestFacingRaise:
-    def test_3bet_with_aces_facing_raise(self):
-        """AA should 3-bet when facing a raise."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("As"), card("Ah")],
-            community=[],
-            position=Position.BTN,
-            num_opponents=3,
-            pot_bb=5.5,
-            to_call_bb=2.5,
-            street="preflop",
-            stack_bb=100.0,
+class TestShortStackPushFold:
+    @pytest.mark.parametrize(
+        "hole,position,opponents,pot,to_call,stack,invested,expected",
+        [
+            # AA should shove with a short stack
+            pytest.param("As Ah", Position.BTN, 2, 1.5, 0.0, 8.0, 0.0,
+                         ActionType.ALL_IN, id="premium_shove_short_stack"),
+            # 72o should fold even when short-stacked
+            pytest.param("7d 2c", Position.UTG, 5, 1.5, 1.0, 8.0, 0.0,
+                         ActionType.FOLD, id="trash_folds_short_stack"),
+            # With 5 BB, push range should be wider — K7o is a shove
+            pytest.param("Kd 7h", Position.BTN, 2, 1.5, 0.0, 5.0, 1.0,
+                         ActionType.ALL_IN, id="wider_push_very_short"),
+            # With 100 BB, should open-raise, not shove
+            pytest.param("As Ah", Position.BTN, 2, 1.5, 0.0, 100.0, 0.0,
+                         ActionType.RAISE, id="deep_stack_does_not_push"),
+        ],
+    )
+    def test_push_fold(
+        self, bot_no_bluff, hole, position, opponents, pot, to_call, stack,
+        invested, expected,
+    ):
+        state = _preflop_state(
+            hole, position, opponents, pot, to_call, stack, invested
         )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.RAISE
-        assert "3-bet" in decision.reasoning
+        assert bot_no_bluff.decide(state).action.type == expected
 
-    def test_call_with_mid_pair_facing_raise(self):
-        """88 should call a raise, not fold."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("8s"), card("8h")],
-            community=[],
-            position=Position.CO,
-            num_opponents=3,
-            pot_bb=5.5,
-            to_call_bb=2.5,
-            street="preflop",
-            stack_bb=100.0,
-        )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.CALL
 
-    def test_fold_trash_facing_raise(self):
-        """72o should fold facing a raise."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0))
-        state = GameState(
-            hole_cards=[card("7d"), card("2c")],
-            community=[],
-            position=Position.CO,
-            num_opponents=3,
-            pot_bb=5.5,
-            to_call_bb=2.5,
-            street="preflop",
-            stack_bb=100.0,
-        )
-        decision = bot.decide(state)
-        assert decision.action.type == ActionType.FOLD
+class TestFacingRaise:
+    @pytest.mark.parametrize(
+        "hole,position,expected,reason",
+        [
+            # AA should 3-bet when facing a raise
+            pytest.param("As Ah", Position.BTN, ActionType.RAISE, "3-bet",
+                         id="3bet_with_aces"),
+            # 88 should call a raise, not fold
+            pytest.param("8s 8h", Position.CO, ActionType.CALL, "",
+                         id="call_with_mid_pair"),
+            # 72o should fold facing a raise
+            pytest.param("7d 2c", Position.CO, ActionType.FOLD, "",
+                         id="fold_trash"),
+        ],
+    )
+    def test_facing_raise(self, bot_no_bluff, hole, position, expected, reason):
+        state = _preflop_state(hole, position, 3, 5.5, 2.5, 100.0)
+        decision = bot_no_bluff.decide(state)
+        assert decision.action.type == expected
+        assert reason in decision.reasoning
 
 
 class TestPotCommitment:
-    def test_pot_committed_calls_with_marginal_equity(self):
+    def test_pot_committed_calls_with_marginal_equity(self, bot_balanced):
         """When >40% of stack invested, should call with weak equity rather than fold."""
-        bot = Bot(BotConfig(seed=42, bluff_frequency=0.0, aggression=0.5))
         state = GameState(
-            hole_cards=[card("Td"), card("9d")],
-            community=[card("As"), card("7c"), card("2h")],
+            hole_cards=(CARDS["Td"], CARDS["9d"]),
+            community=(CARDS["As"], CARDS["7c"], CARDS["2h"]),
             position=Position.BTN,
             num_opponents=1,
             pot_bb=30.0,
@@ -377,6 +332,6 @@ class TestPotCommitment:
             stack_bb=10.0,
             invested_bb=15.0,  # invested 60% of 25 BB effective stack
         )
-        decision = bot.decide(state)
+        decision = bot_balanced.decide(state)
         # Should call rather than fold due to pot commitment
         assert decision.action.type in (ActionType.CALL, ActionType.RAISE)
@@ -1,70 +1,99 @@
 """Tests for odds calculator."""
 
 import pytest
-from pokerithm.card import card
 from pokerithm.calculator import calculate_equity, calculate_outs, preflop_equity
 from pokerithm.hand import HandRank
+from tests.cards import CARDS
 
 
+@pytest.mark.slow
 class TestEquityCalculator:
     def test_aces_vs_kings_preflop(self):
         """AA vs KK - aces should win ~80% of the time."""
         result = calculate_equity(
-            hero_cards=[card("As"), card("Ah")],
-            villain_cards=[card("Ks"), card("Kh")],
-            num_simulations=5000,
+            hero_cards=[CARDS["As"], CARDS["Ah"]],
+            villain_cards=[CARDS["Ks"], CARDS["Kh"]],
+            num_simulations=1000,
+            seed=1,
         )
-        # AA vs KK is roughly 80-20
-        assert 75 < result.win_percent < 85
+        # AA vs KK is roughly 82-18 (standard error ~1.2 points at 1000 runs)
+        assert result.win_percent == pytest.approx(82.4, abs=3)
         assert result.win_rate + result.tie_rate + result.lose_rate == pytest.approx(1.0)
 
     def test_dominated_hand(self):
         """AK vs A5 - AK should dominate."""
         result = calculate_equity(
-            hero_cards=[card("As"), card("Kh")],
-            villain_cards=[card("Ad"), card("5c")],
-            num_simulations=5000,
+            hero_cards=[CARDS["As"], CARDS["Kh"]],
+            villain_cards=[CARDS["Ad"], CARDS["5c"]],
+            num_simulations=1000,
+            seed=1,
         )
-        # AK dominates A5, should win ~70%+
-        assert result.win_percent > 65
+        # AK dominates A5, should win ~70%
+        assert result.win_percent == pytest.approx(69.7, abs=3.5)
 
     def test_coin_flip(self):
         """Pair vs two overcards is roughly 50-50."""
         result = calculate_equity(
-            hero_cards=[card("Jd"), card("Jc")],  # Pocket jacks
-            villain_cards=[card("As"), card("Kh")],  # AK
-            num_simulations=5000,
+            hero_cards=[CARDS["Jd"], CARDS["Jc"]],  # Pocket jacks
+            villain_cards=[CARDS["As"], CARDS["Kh"]],  # AK
+            num_simulations=1000,
+            seed=1,
         )
-        # JJ vs AK is roughly 55-45
-        assert 45 < result.win_percent < 65
+        # JJ vs AK is roughly 57-43
+        assert result.win_percent == pytest.approx(56.8, abs=3.5)
 
     def test_with_community_cards(self):
-        """Test equity calculation with known community cards."""
+        """Known hands on a flop are enumerated exactly."""
         result = calculate_equity(
-            hero_cards=[card("As"), card("Ks")],
-            villain_cards=[card("Jd"), card("Jc")],
-            community=[card("Qs"), card("Js"), card("2h")],  # Villain has trips
-            num_simulations=5000,
+            hero_cards=[CARDS["As"], CARDS["Ks"]],
+            villain_cards=[CARDS["Jd"], CARDS["Jc"]],
+            community=[CARDS["Qs"], CARDS["Js"], CARDS["2h"]],  # Villain has trips
+            mode="exhaustive",
         )
         # Hero has flush draw + gutshot, villain has trips
-        # Hero needs flush or straight to win
-        assert result.simulations == 5000
+        # Hero needs flush or straight to win: 335 of the C(45, 2) run-outs
+        assert result.simulations == 990
+        assert result.win_rate * 990 == pytest.approx(335)
+        assert result.tie_rate == 0
+        assert sum(result.hand_distribution.values()) == 990
+
+    def test_auto_mode_enumerates_small_spots(self):
+        """Auto mode enumerates when there are fewer run-outs than sims."""
+        hero = [CARDS["As"], CARDS["Ks"]]
+        villain = [CARDS["Jd"], CARDS["Jc"]]
+        board = [CARDS["Qs"], CARDS["Js"], CARDS["2h"]]
+
+        auto = calculate_equity(hero, villain, board, num_simulations=1000)
+        sampled = calculate_equity(
+            hero, villain, board, num_simulations=1000, mode="mc"
+        )
+        assert auto.simulations == 990
+        assert sampled.simulations == 1000
+
+    def test_exhaustive_needs_known_opponents(self):
+        with pytest.raises(ValueError):
+            calculate_equity(
+                hero_cards=[CARDS["As"], CARDS["Ah"]],
+                community=[CARDS["Qs"], CARDS["Js"], CARDS["2h"]],
+                mode="exhaustive",
+            )
 
     def test_random_villain(self):
         """Test equity against unknown opponent."""
         result = calculate_equity(
-            hero_cards=[card("As"), card("Ah")],
+            hero_cards=[CARDS["As"], CARDS["Ah"]],
             villain_cards=None,  # Random opponent
-            num_simulations=3000,
+            num_simulations=1000,
+            seed=1,
         )
         # AA vs random should win ~85%
-        assert result.win_percent > 80
+        assert result.win_percent == pytest.approx(84.9, abs=3)
 
     def test_hand_distribution(self):
         """Check that hand distribution is tracked."""
         result = calculate_equity(
-            hero_cards=[card("As"), card("Ah")],
-            villain_cards=[card("Ks"), card("Kh")],
+            hero_cards=[CARDS["As"], CARDS["Ah"]],
+            villain_cards=[CARDS["Ks"], CARDS["Kh"]],
             num_simulations=1000,
         )
         total_hands = sum(result.hand_distribution.values())
@@ -75,49 +104,65 @@ class TestOutsCalculator:
     def test_flush_draw_outs(self):
         """Four to a flush has 9 outs."""
         outs_list = calculate_outs(
-            hole_cards=[card("As"), card("Ks")],
-            community=[card("5s"), card("7s"), card("Jd")],  # 4 spades
+            hole_cards=[CARDS["As"], CARDS["Ks"]],
+            community=[CARDS["5s"], CARDS["7s"], CARDS["Jd"]],  # 4 spades
         )
-        # Should have outs to flush
-        flush_outs = [o for o in outs_list if o.improves_to == HandRank.FLUSH]
-        assert len(flush_outs) > 0
+        outs_by_rank = {o.improves_to: o for o in outs_list}
         # 9 remaining spades
-        assert flush_outs[0].count == 9
+        assert outs_by_rank[HandRank.FLUSH].count == 9
 
     def test_straight_draw_outs(self):
         """Open-ended straight draw has 8 outs."""
         outs_list = calculate_outs(
-            hole_cards=[card("9s"), card("8d")],
-            community=[card("7h"), card("6c"), card("2s")],  # 9-8-7-6
+            hole_cards=[CARDS["9s"], CARDS["8d"]],
+            community=[CARDS["7h"], CARDS["6c"], CARDS["2s"]],  # 9-8-7-6
         )
-        # Should have outs to straight (any 5 or T)
-        straight_outs = [o for o in outs_list if o.improves_to == HandRank.STRAIGHT]
-        assert len(straight_outs) > 0
-        # 4 fives + 4 tens = 8 outs
-        assert straight_outs[0].count == 8
+        outs_by_rank = {o.improves_to: o for o in outs_list}
+        # Outs to a straight are any 5 or T: 4 fives + 4 tens = 8 outs
+        assert outs_by_rank[HandRank.STRAIGHT].count == 8
 
 
+@pytest.mark.slow
 class TestPreflopEquity:
     def test_aces_preflop(self):
         """Pocket aces vs 1 random opponent."""
         equity = preflop_equity(
-            hero_cards=[card("As"), card("Ah")],
+            hero_cards=[CARDS["As"], CARDS["Ah"]],
             num_opponents=1,
-            num_simulations=3000,
+            num_simulations=1000,
+            seed=1,
         )
         # AA vs random ~85%
-        assert equity > 80
+        assert equity == pytest.approx(85.3, abs=3)
 
     def test_more_opponents_reduces_equity(self):
         """More opponents = lower equity."""
         equity_1 = preflop_equity(
-            hero_cards=[card("As"), card("Ah")],
+            hero_cards=[CARDS["As"], CARDS["Ah"]],
             num_opponents=1,
-            num_simulations=2000,
+            num_simulations=500,
+            seed=1,
         )
         equity_3 = preflop_equity(
-            hero_cards=[card("As"), card("Ah")],
+            hero_cards=[CARDS["As"], CARDS["Ah"]],
             num_opponents=3,
-            num_simulations=2000,
+            num_simulations=500,
+            seed=1,
         )
         assert equity_1 > equity_3
+
+    def test_seeded_calls_share_range_key(self):
+        """Suit-isomorphic hands hit the same cached preflop run."""
+        spades = preflop_equity([CARDS["As"], CARDS["Ks"]], 1, 200, seed=3)
+        hearts = preflop_equity([CARDS["Kh"], CARDS["Ah"]], 1, 200, seed=3)
+        assert spades == hearts
+
+    def test_seed_reproduces_equity(self):
+        """The same seed gives the same sample."""
+        hero = [CARDS["Jd"], CARDS["Jc"]]
+        assert preflop_equity(hero, 2, 300, seed=7) == preflop_equity(
+            hero, 2, 300, seed=7
+        )
+        first = calculate_equity(hero, num_simulations=300, seed=7)
+        again = calculate_equity(hero, num_simulations=300, seed=7)
+        assert first == again
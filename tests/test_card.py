@@ -26,6 +26,8 @@ class TestCard:
 
     def test_card_shorthand(self):
         assert card("As") == Card(Rank.ACE, Suit.SPADES)
+        # Parsed once, then shared
+        assert card("As") is card("As")
 
     def test_invalid_card(self):
         with pytest.raises(ValueError):
@@ -1,17 +1,17 @@
 """Tests for game evaluation."""
 
-from pokerithm.card import card
 from pokerithm.evaluator import PlayerHand, evaluate_game, compare_hands
 from pokerithm.hand import Hand, HandRank
+from tests.cards import CARDS
 
 
 class TestEvaluateGame:
     def test_single_winner(self):
         players = [
-            PlayerHand("Alice", [card("As"), card("Ad")]),  # Pair of aces in hole
-            PlayerHand("Bob", [card("Ks"), card("Kd")]),    # Pair of kings in hole
+            PlayerHand("Alice", [CARDS["As"], CARDS["Ad"]]),  # Pair of aces in hole
+            PlayerHand("Bob", [CARDS["Ks"], CARDS["Kd"]]),    # Pair of kings in hole
         ]
-        community = [card("2h"), card("5c"), card("9s"), card("Jd"), card("3h")]
+        community = [CARDS["2h"], CARDS["5c"], CARDS["9s"], CARDS["Jd"], CARDS["3h"]]
 
         result = evaluate_game(players, community)
 
@@ -23,11 +23,11 @@ class TestEvaluateGame:
 
     def test_tie_game(self):
         players = [
-            PlayerHand("Alice", [card("As"), card("2d")]),
-            PlayerHand("Bob", [card("Ac"), card("3d")]),
+            PlayerHand("Alice", [CARDS["As"], CARDS["2d"]]),
+            PlayerHand("Bob", [CARDS["Ac"], CARDS["3d"]]),
         ]
         # Community makes the best hand for both (broadway straight)
-        community = [card("Kh"), card("Qh"), card("Jh"), card("Th"), card("4s")]
+        community = [CARDS["Kh"], CARDS["Qh"], CARDS["Jh"], CARDS["Th"], CARDS["4s"]]
 
         result = evaluate_game(players, community)
 
@@ -37,10 +37,10 @@ class TestEvaluateGame:
 
     def test_flush_beats_straight(self):
         players = [
-            PlayerHand("Alice", [card("2s"), card("3s")]),  # Will make flush
-            PlayerHand("Bob", [card("9d"), card("8c")]),    # Will make straight
+            PlayerHand("Alice", [CARDS["2s"], CARDS["3s"]]),  # Will make flush
+            PlayerHand("Bob", [CARDS["9d"], CARDS["8c"]]),    # Will make straight
         ]
-        community = [card("As"), card("Ks"), card("7s"), card("6h"), card("5d")]
+        community = [CARDS["As"], CARDS["Ks"], CARDS["7s"], CARDS["6h"], CARDS["5d"]]
 
         result = evaluate_game(players, community)
 
@@ -51,10 +51,10 @@ class TestEvaluateGame:
 
     def test_kicker_decides(self):
         players = [
-            PlayerHand("Alice", [card("As"), card("Kd")]),  # Pair of aces, K kicker
-            PlayerHand("Bob", [card("Ac"), card("Qd")]),    # Pair of aces, Q kicker
+            PlayerHand("Alice", [CARDS["As"], CARDS["Kd"]]),  # Pair of aces, K kicker
+            PlayerHand("Bob", [CARDS["Ac"], CARDS["Qd"]]),    # Pair of aces, Q kicker
         ]
-        community = [card("Ad"), card("5h"), card("7c"), card("9s"), card("2h")]
+        community = [CARDS["Ad"], CARDS["5h"], CARDS["7c"], CARDS["9s"], CARDS["2h"]]
 
         result = evaluate_game(players, community)
 
@@ -64,11 +64,11 @@ class TestEvaluateGame:
 
     def test_all_hands_ranked(self):
         players = [
-            PlayerHand("Alice", [card("2s"), card("3d")]),
-            PlayerHand("Bob", [card("As"), card("Ad")]),
-            PlayerHand("Charlie", [card("Ks"), card("Kd")]),
+            PlayerHand("Alice", [CARDS["2s"], CARDS["3d"]]),
+            PlayerHand("Bob", [CARDS["As"], CARDS["Ad"]]),
+            PlayerHand("Charlie", [CARDS["Ks"], CARDS["Kd"]]),
         ]
-        community = [card("5h"), card("7c"), card("9s"), card("Jd"), card("2h")]
+        community = [CARDS["5h"], CARDS["7c"], CARDS["9s"], CARDS["Jd"], CARDS["2h"]]
 
         result = evaluate_game(players, community)
 
@@ -80,14 +80,14 @@ class TestEvaluateGame:
 
 class TestCompareHands:
     def test_compare_different_ranks(self):
-        flush = Hand([card("As"), card("Ks"), card("9s"), card("5s"), card("2s")])
-        pair = Hand([card("As"), card("Ad"), card("Kh"), card("5c"), card("2h")])
+        flush = Hand([CARDS["As"], CARDS["Ks"], CARDS["9s"], CARDS["5s"], CARDS["2s"]])
+        pair = Hand([CARDS["As"], CARDS["Ad"], CARDS["Kh"], CARDS["5c"], CARDS["2h"]])
 
         assert compare_hands(flush, pair) == 1
         assert compare_hands(pair, flush) == -1
 
     def test_compare_equal_hands(self):
-        hand1 = Hand([card("As"), card("Kd"), card("Qh"), card("Jc"), card("9s")])
-        hand2 = Hand([card("Ac"), card("Kh"), card("Qs"), card("Jd"), card("9h")])
+        hand1 = Hand([CARDS["As"], CARDS["Kd"], CARDS["Qh"], CARDS["Jc"], CARDS["9s"]])
+        hand2 = Hand([CARDS["Ac"], CARDS["Kh"], CARDS["Qs"], CARDS["Jd"], CARDS["9h"]])
 
         assert compare_hands(hand1, hand2) == 0
@@ -1,96 +1,95 @@
 """Tests for hand evaluation."""
 
-from pokerithm.card import card
-from pokerithm.hand import Hand, HandRank
+import random
+from itertools import combinations
+
+import pytest
+
+from pokerithm.evaluator import compare_hands
+from pokerithm.hand import Hand, HandRank, _evaluate_five
+from tests.cards import CARDS
+
+# Canonical five-card hands shared by the ranking and comparison tests
+HAND_CARDS: dict[str, str] = {
+    "high_card": "As Kd 9h 5c 2s",
+    "ace_king_queen": "As Kd Qh 5c 2s",
+    "pair_aces": "As Ad Kh 5c 2s",
+    "pair_kings": "Ks Kd Qh 5c 2s",
+    "kings_ace_kicker": "Ks Kd Ah 5c 2s",
+    "kings_queen_kicker": "Ks Kh Qd 5c 2s",
+    "two_pair": "As Ad Kh Kc 2s",
+    "trip_aces": "As Ad Ah Kc 2s",
+    "nine_high_straight": "9s 8d 7h 6c 5s",
+    "wheel": "As 2d 3h 4c 5s",
+    "broadway": "As Kd Qh Jc Ts",
+    "ace_flush": "As Ks 9s 5s 2s",
+    "king_flush": "Kh Qh 9h 5h 2h",
+    "aces_full": "As Ad Ah Kc Ks",
+    "quad_aces": "As Ad Ah Ac Ks",
+    "straight_flush": "9s 8s 7s 6s 5s",
+    "royal_flush": "As Ks Qs Js Ts",
+}
+
+
+@pytest.fixture(scope="module")
+def hands() -> dict[str, Hand]:
+    """Each canonical hand built once; values are cached on the Hand."""
+    return {
+        name: Hand([CARDS[c] for c in cards.split()])
+        for name, cards in HAND_CARDS.items()
+    }
 
 
 class TestHandRanking:
     """Test that hands are correctly identified."""
 
-    def test_high_card(self):
-        hand = Hand([card("As"), card("Kd"), card("9h"), card("5c"), card("2s")])
-        assert hand.value.rank == HandRank.HIGH_CARD
-
-    def test_one_pair(self):
-        hand = Hand([card("As"), card("Ad"), card("Kh"), card("5c"), card("2s")])
-        assert hand.value.rank == HandRank.ONE_PAIR
-        assert hand.value.primary == (14,)  # Pair of aces
-
-    def test_two_pair(self):
-        hand = Hand([card("As"), card("Ad"), card("Kh"), card("Kc"), card("2s")])
-        assert hand.value.rank == HandRank.TWO_PAIR
-        assert hand.value.primary == (14, 13)  # Aces and kings
-
-    def test_three_of_a_kind(self):
-        hand = Hand([card("As"), card("Ad"), card("Ah"), card("Kc"), card("2s")])
-        assert hand.value.rank == HandRank.THREE_OF_A_KIND
-        assert hand.value.primary == (14,)
-
-    def test_straight(self):
-        hand = Hand([card("9s"), card("8d"), card("7h"), card("6c"), card("5s")])
-        assert hand.value.rank == HandRank.STRAIGHT
-        assert hand.value.primary == (9,)  # 9-high straight
-
-    def test_straight_wheel(self):
-        """A-2-3-4-5 is the lowest straight (wheel)."""
-        hand = Hand([card("As"), card("2d"), card("3h"), card("4c"), card("5s")])
-        assert hand.value.rank == HandRank.STRAIGHT
-        assert hand.value.primary == (5,)  # 5-high (ace plays low)
-
-    def test_straight_broadway(self):
-        """A-K-Q-J-10 is the highest straight (broadway)."""
-        hand = Hand([card("As"), card("Kd"), card("Qh"), card("Jc"), card("Ts")])
-        assert hand.value.rank == HandRank.STRAIGHT
-        assert hand.value.primary == (14,)
-
-    def test_flush(self):
-        hand = Hand([card("As"), card("Ks"), card("9s"), card("5s"), card("2s")])
-        assert hand.value.rank == HandRank.FLUSH
-
-    def test_full_house(self):
-        hand = Hand([card("As"), card("Ad"), card("Ah"), card("Kc"), card("Ks")])
-        assert hand.value.rank == HandRank.FULL_HOUSE
-        assert hand.value.primary == (14, 13)  # Aces full of kings
-
-    def test_four_of_a_kind(self):
-        hand = Hand([card("As"), card("Ad"), card("Ah"), card("Ac"), card("Ks")])
-        assert hand.value.rank == HandRank.FOUR_OF_A_KIND
-        assert hand.value.primary == (14,)
-
-    def test_straight_flush(self):
-        hand = Hand([card("9s"), card("8s"), card("7s"), card("6s"), card("5s")])
-        assert hand.value.rank == HandRank.STRAIGHT_FLUSH
-        assert hand.value.primary == (9,)
-
-    def test_royal_flush(self):
-        """Royal flush is just the highest straight flush."""
-        hand = Hand([card("As"), card("Ks"), card("Qs"), card("Js"), card("Ts")])
-        assert hand.value.rank == HandRank.STRAIGHT_FLUSH
-        assert hand.value.primary == (14,)
+    @pytest.mark.parametrize(
+        "name,rank,primary",
+        [
+            ("high_card", HandRank.HIGH_CARD, None),
+            ("pair_aces", HandRank.ONE_PAIR, (14,)),
+            ("two_pair", HandRank.TWO_PAIR, (14, 13)),  # Aces and kings
+            ("trip_aces", HandRank.THREE_OF_A_KIND, (14,)),
+            ("nine_high_straight", HandRank.STRAIGHT, (9,)),
+            # A-2-3-4-5 is the lowest straight; the ace plays low
+            ("wheel", HandRank.STRAIGHT, (5,)),
+            # A-K-Q-J-10 is the highest straight
+            ("broadway", HandRank.STRAIGHT, (14,)),
+            ("ace_flush", HandRank.FLUSH, None),
+            ("aces_full", HandRank.FULL_HOUSE, (14, 13)),  # Aces full of kings
+            ("quad_aces", HandRank.FOUR_OF_A_KIND, (14,)),
+            ("straight_flush", HandRank.STRAIGHT_FLUSH, (9,)),
+            # Royal flush is just the highest straight flush
+            ("royal_flush", HandRank.STRAIGHT_FLUSH, (14,)),
+        ],
+    )
+    def test_hand_ranking(self, hands, name, rank, primary):
+        value = hands[name].value
+        assert value.rank == rank
+        if primary is not None:
+            assert value.primary == primary
+
+    def test_value_is_cached(self, hands):
+        hand = hands["pair_aces"]
+        assert hand.value is hand.value
 
 
 class TestHandComparison:
     """Test that hands compare correctly."""
 
-    def test_rank_beats_rank(self):
-        pair = Hand([card("As"), card("Ad"), card("Kh"), card("5c"), card("2s")])
-        high_card = Hand([card("As"), card("Kd"), card("Qh"), card("5c"), card("2s")])
-        assert pair.value > high_card.value
-
-    def test_higher_pair_wins(self):
-        pair_aces = Hand([card("As"), card("Ad"), card("Kh"), card("5c"), card("2s")])
-        pair_kings = Hand([card("Ks"), card("Kd"), card("Qh"), card("5c"), card("2s")])
-        assert pair_aces.value > pair_kings.value
-
-    def test_same_pair_kicker_decides(self):
-        pair_ace_kicker = Hand([card("Ks"), card("Kd"), card("Ah"), card("5c"), card("2s")])
-        pair_queen_kicker = Hand([card("Ks"), card("Kh"), card("Qd"), card("5c"), card("2s")])
-        assert pair_ace_kicker.value > pair_queen_kicker.value
-
-    def test_flush_high_card_wins(self):
-        flush_ace = Hand([card("As"), card("Ks"), card("9s"), card("5s"), card("2s")])
-        flush_king = Hand([card("Kh"), card("Qh"), card("9h"), card("5h"), card("2h")])
-        assert flush_ace.value > flush_king.value
+    @pytest.mark.parametrize(
+        "first,second,expected",
+        [
+            ("pair_aces", "ace_king_queen", 1),  # rank beats rank
+            ("pair_aces", "pair_kings", 1),  # higher pair wins
+            ("kings_ace_kicker", "kings_queen_kicker", 1),  # kicker decides
+            ("ace_flush", "king_flush", 1),  # flush high card wins
+            ("pair_kings", "pair_aces", -1),
+            ("wheel", "wheel", 0),
+        ],
+    )
+    def test_compare(self, hands, first, second, expected):
+        assert compare_hands(hands[first], hands[second]) == expected
 
 
 class TestSevenCardHand:
@@ -99,16 +98,41 @@ class TestSevenCardHand:
     def test_best_five_selected(self):
         # 7 cards: should find the flush
         hand = Hand([
-            card("As"), card("Ks"), card("Qs"),  # 3 spades
-            card("Js"), card("9s"),              # 2 more spades = flush
-            card("2h"), card("3d"),              # garbage
+            CARDS["As"], CARDS["Ks"], CARDS["Qs"],  # 3 spades
+            CARDS["Js"], CARDS["9s"],              # 2 more spades = flush
+            CARDS["2h"], CARDS["3d"],              # garbage
         ])
         assert hand.value.rank == HandRank.FLUSH
 
     def test_finds_straight(self):
         hand = Hand([
-            card("9s"), card("8d"), card("7h"), card("6c"), card("5s"),
-            card("2h"), card("2d"),
+            CARDS["9s"], CARDS["8d"], CARDS["7h"], CARDS["6c"], CARDS["5s"],
+            CARDS["2h"], CARDS["2d"],
         ])
         # Straight beats the pair
         assert hand.value.rank == HandRank.STRAIGHT
+
+    def test_two_trips_make_full_house(self):
+        hand = Hand([
+            CARDS["9s"], CARDS["9d"], CARDS["9h"], CARDS["5c"], CARDS["5s"],
+            CARDS["5h"], CARDS["2d"],
+        ])
+        assert hand.value.rank == HandRank.FULL_HOUSE
+        assert hand.value.primary == (9, 5)
+
+    def test_matches_best_of_every_five(self):
+        """The one-pass evaluator agrees with brute force over 5-card subsets."""
+        rng = random.Random(0)
+        deck = list(CARDS.values())
+        # Narrow decks make the rarer hands (quads, straight flushes) common
+        pools = [
+            deck,
+            [c for c in deck if c.rank.value in (2, 3, 4, 5, 14)],
+            [c for c in deck if c.suit in (0, 1)],
+            [c for c in deck if c.rank.value in (9, 10, 11)],
+        ]
+        for _ in range(2000):
+            pool = rng.choice(pools)
+            cards = rng.sample(pool, rng.choice((6, 7)))
+            best = max(_evaluate_five(list(five)) for five in combinations(cards, 5))
+            assert Hand(cards).value == best, cards
@@ -63,11 +63,24 @@ class TestPositionFromUtgDistance:
         assert position_from_utg_distance(0, 2) == Position.SB
         assert position_from_utg_distance(1, 2) == Position.BB
 
+    def test_beyond_precomputed_seats(self):
+        """Tables larger than MAX_SEATS still map, compressing extra seats into MP."""
+        positions = [position_from_utg_distance(d, 12) for d in range(12)]
+        assert positions[:3] == [Position.UTG, Position.UTG_1, Position.MP]
+        assert positions[6] == Position.MP
+        assert positions[-5:] == [
+            Position.HJ, Position.CO, Position.BTN, Position.SB, Position.BB,
+        ]
+
     def test_invalid_distance(self):
         with pytest.raises(ValueError):
             position_from_utg_distance(-1, 6)
         with pytest.raises(ValueError):
             position_from_utg_distance(6, 6)
+        with pytest.raises(ValueError):
+            position_from_utg_distance(0, -3)
+        with pytest.raises(ValueError):
+            position_from_utg_distance(12, 12)
 
     def test_regression_matches_old_labels(self):
         """Ensure the new enum produces the same labels as the old _get_position_name."""
@@ -1,7 +1,7 @@
 """Tests for pot management and side pot calculation."""
 
 from pokerithm.player import Player
-from pokerithm.pot import PotManager
+from pokerithm.pot import PotManager, _side_pot_core
 
 
 class TestPotManager:
@@ -66,6 +66,9 @@ class TestSidePots:
         assert pots[0].amount == 200
         # Only p2 is eligible (p1 folded)
         assert pots[0].eligible_players == [p2]
+        assert pots[0].eligible_mask == 1 << p2.seat
+        assert pots[0].is_eligible(p2)
+        assert not pots[0].is_eligible(p1)
 
     def test_no_bets_no_pots(self):
         """No bets = no pots."""
@@ -98,3 +101,11 @@ class TestSidePots:
         # Side pot 2: 150 * 1 = 150
         assert pots[2].amount == 150
         assert len(pots[2].eligible_players) == 1
+
+    def test_side_pot_core_levels(self):
+        """The numeric core returns (level, amount) per distinct bet level."""
+        assert _side_pot_core([300, 50, 150, 150]) == [
+            (50, 200),
+            (150, 300),
+            (300, 150),
+        ]
@@ -1,8 +1,11 @@
 """Tests for table (single-hand orchestrator)."""
 
+import random
+
 from pokerithm.action import Action, ActionType
 from pokerithm.bot import BotConfig
 from pokerithm.player import Player, PlayerActionContext
+from pokerithm.pot import PotManager, SidePot
 from pokerithm.table import Table
 
 
@@ -11,6 +14,15 @@ def _fold_action(player: Player, ctx: PlayerActionContext) -> Action:
     return Action(ActionType.FOLD)
 
 
+def _winnable(players: list[Player], pots: list[SidePot]) -> dict[str, int]:
+    """Chips each player still in the hand is eligible to win."""
+    return {
+        p.name: sum(sp.amount for sp in pots if p in sp.eligible_players)
+        for p in players
+        if p.is_in_hand
+    }
+
+
 class TestTable:
     def test_all_fold_to_one_player(self):
         """When everyone folds, last player wins the pot."""
@@ -102,3 +114,53 @@ class TestTable:
 
         table.play_hand()
         assert sum(p.chips for p in players) == initial_total
+
+    def test_single_pot_without_all_ins(self):
+        """With no all-ins, the one-pot shortcut matches the side-pot split."""
+        rng = random.Random(7)
+
+        def call_raise_or_fold(p: Player, ctx: PlayerActionContext) -> Action:
+            roll = rng.random()
+            if roll < 0.2 and ctx.to_call > 0:
+                return Action(ActionType.FOLD)
+            if roll > 0.85:
+                return Action(ActionType.RAISE, ctx.min_raise)
+            if ctx.to_call > 0:
+                return Action(ActionType.CALL)
+            return Action(ActionType.CHECK)
+
+        for hand in range(25):
+            players = [
+                Player(name=f"P{i}", chips=100_000, seat=i, is_human=True)
+                for i in range(4)
+            ]
+            table = Table(
+                players=players,
+                dealer_seat=hand % 4,
+                small_blind=10,
+                big_blind=20,
+                get_human_action=call_raise_or_fold,
+                rng=random.Random(hand),
+            )
+            result = table.play_hand()
+            assert not any(p.is_all_in for p in players)
+
+            # Each player can win the same chips either way
+            side_pots = PotManager.calculate_side_pots(players)
+            assert _winnable(players, result.pots) == _winnable(players, side_pots)
+            assert sum(p.chips for p in players) == 400_000
+
+    def test_find_seat_index_skips_empty_seats(self):
+        """A missing dealer seat resolves to the next seat clockwise."""
+        table = Table(players=[], dealer_seat=0, small_blind=5, big_blind=10)
+        seats = [1, 3, 6]
+
+        assert [table._find_seat_index(seats, t) for t in range(8)] == [
+            0, 0, 1, 1, 2, 2, 2, 0,
+        ]
+        # A bust shrinks the alive seats, which rebuilds the lookup
+        assert table._find_seat_index([1, 6], 3) == 1
+        # Reseating at the same count rebuilds it too
+        assert table._find_seat_index([0, 3], 1) == 1
+        assert table._find_seat_index([0, 1, 2], 1) == 1
+        assert table._find_seat_index([3, 4, 5], 4) == 1
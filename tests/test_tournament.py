@@ -1,8 +1,17 @@
 """Tests for tournament loop."""
 
+from array import array
+
 from pokerithm.action import Action, ActionType
+from pokerithm.bot import BotConfig
 from pokerithm.player import Player, PlayerActionContext
-from pokerithm.tournament import BlindLevel, Tournament, TournamentConfig
+from pokerithm.tournament import (
+    RESULT_FIELDS,
+    BlindLevel,
+    Tournament,
+    TournamentConfig,
+    blind_schedule_from,
+)
 
 
 def _make_tournament(
@@ -52,21 +61,15 @@ class TestTournament:
         # Run just a few hands by capping via callback
         hand_count = [0]
 
-        class StopAfterN(Exception):
-            pass
-
         def stop_after_3(result):
             hand_count[0] += 1
-            if hand_count[0] >= 3:
-                raise StopAfterN
+            return hand_count[0] < 3
 
         tournament.on_hand_end = stop_after_3
 
-        try:
-            tournament.run()
-        except StopAfterN:
-            pass
+        tournament.run()
 
+        assert tournament.hand_number == 3
         assert len(dealers) >= 3
         # Dealers should be different (rotation)
         assert len(set(dealers)) > 1
@@ -92,20 +95,13 @@ class TestTournament:
 
         hand_count = [0]
 
-        class StopAfterN(Exception):
-            pass
-
         def stop_after_7(result):
             hand_count[0] += 1
-            if hand_count[0] >= 7:
-                raise StopAfterN
+            return hand_count[0] < 7
 
         tournament.on_hand_end = stop_after_7
 
-        try:
-            tournament.run()
-        except StopAfterN:
-            pass
+        tournament.run()
 
         # After 3 hands, blinds should increase at least once
         assert len(blind_levels) >= 1
@@ -143,20 +139,13 @@ class TestTournament:
 
         hand_count = [0]
 
-        class StopAfterN(Exception):
-            pass
-
         def stop_after_10(result):
             hand_count[0] += 1
-            if hand_count[0] >= 10:
-                raise StopAfterN
+            return hand_count[0] < 10
 
         tournament.on_hand_end = stop_after_10
 
-        try:
-            tournament.run()
-        except StopAfterN:
-            pass
+        tournament.run()
 
         # Poor should be eliminated (only 15 chips, BB is 10)
         assert "Poor" in eliminated
@@ -194,3 +183,100 @@ class TestTournament:
         result = tournament.run()
         assert winner_name[0] is not None
         assert result.chips > 0
+
+    def test_run_batch_is_reproducible(self):
+        """Seeded batch runs give the same winners and leave players alone."""
+        tournament, players = _make_tournament()
+        tournament.bot_configs = {
+            p.name: BotConfig(seed=i) for i, p in enumerate(players)
+        }
+
+        first = tournament.run_batch([1, 2], max_workers=2)
+        second = tournament.run_batch([1, 2], max_workers=2)
+
+        assert [(w.name, w.chips) for w in first] == [
+            (w.name, w.chips) for w in second
+        ]
+        assert all(w.chips == 300 for w in first)
+        assert all(p.chips == 100 for p in players)
+
+    def test_result_buffer_records_every_hand(self):
+        """Each hand appends one (hand, dealer, winner, pot) record."""
+        tournament, players = _make_tournament()
+        tournament.bot_configs = {
+            p.name: BotConfig(seed=i) for i, p in enumerate(players)
+        }
+        for p in players:
+            p.is_human = False
+        tournament.result_buffer = array("i")
+        hands: list[int] = []
+        tournament.on_hand_end = lambda result: hands.append(
+            sum(pot.amount for pot in result.pots)
+        )
+
+        tournament.run()
+
+        width = len(RESULT_FIELDS)
+        buf = tournament.result_buffer
+        assert len(buf) == width * tournament.hand_number
+        assert list(buf[0::width]) == list(range(1, tournament.hand_number + 1))
+        assert list(buf[3::width]) == hands
+        seats = {p.seat for p in players}
+        assert all(seat in seats for seat in buf[1::width])
+        assert all(seat in seats for seat in buf[2::width])
+
+    def test_bots_are_built_once_per_tournament(self, monkeypatch):
+        """The table persists across hands, so each bot is created once."""
+        import pokerithm.bot
+
+        created: list[BotConfig] = []
+        real_bot = pokerithm.bot.Bot
+
+        def counting_bot(config):
+            created.append(config)
+            return real_bot(config)
+
+        monkeypatch.setattr(pokerithm.bot, "Bot", counting_bot)
+        tournament, players = _make_tournament()
+        for p in players:
+            p.is_human = False
+
+        tournament.run()
+
+        assert tournament.hand_number > 1
+        assert len(created) == len(players)
+
+    def test_blind_schedule_from_pairs(self):
+        """(sb, bb) pairs build the same levels as BlindLevel does."""
+        assert blind_schedule_from([(5, 10), (10, 20)]) == [
+            BlindLevel(5, 10),
+            BlindLevel(10, 20),
+        ]
+
+    def _shove_out(
+        self, seed: int, stacks: list[int]
+    ) -> tuple[list[tuple[str, int]], Player]:
+        """Play a seeded tournament where everyone shoves every hand."""
+        tournament, players = _make_tournament(num_players=len(stacks))
+        for p, chips in zip(players, stacks):
+            p.chips = chips
+        tournament.seed = seed
+        tournament.get_human_action = lambda p, ctx: Action(
+            ActionType.ALL_IN, ctx.max_raise
+        )
+        places: list[tuple[str, int]] = []
+        tournament.on_elimination = lambda p, place: places.append((p.name, place))
+        winner = tournament.run()
+        return places, winner
+
+    def test_finish_positions_count_down(self):
+        """One bust per hand: places run from last up to second."""
+        places, winner = self._shove_out(16, [40, 80, 160, 320])
+        assert places == [("P2", 4), ("P0", 3), ("P3", 2)]
+        assert winner.name == "P1"
+
+    def test_same_hand_busts_share_a_place(self):
+        """Players busting on the same hand tie for the place below the survivors."""
+        places, winner = self._shove_out(0, [40, 80, 160, 320])
+        assert places == [("P0", 3), ("P1", 3), ("P3", 2)]
+        assert winner.name == "P2"